@@ -17,6 +17,9 @@ class Settings(BaseSettings):
         database=os.getenv("DB_DATABASE")
     )
     SQL_URL: str = ""
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_RECYCLE_SECONDS: int = 300
 
     # Security config
     JWT_SECRET_KEY: str = os.getenv("JWT_SECRET_KEY")
@@ -1,16 +1,28 @@
+from functools import lru_cache
 from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
 
 
-sql_engine = create_engine(settings.SQL_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=sql_engine)
+SessionLocal = sessionmaker(autocommit=False, autoflush=False)
 Base = declarative_base()
 
 
+@lru_cache(maxsize=None)
+def get_engine():
+    """Create the pooled engine on first use instead of at import time"""
+    return create_engine(
+        settings.SQL_URL,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_pre_ping=True,
+        pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+    )
+
+
 def get_db():
-    db = SessionLocal()
+    db = SessionLocal(bind=get_engine())
     try:
         yield db
     finally:
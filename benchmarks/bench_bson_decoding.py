@@ -0,0 +1,89 @@
+"""
+Benchmark full BSON decoding against lazy RawBSONDocument decoding.
+
+Encodes research_papers_v2-shaped documents (padded with fields the
+pipeline never reads) and times MongoExtractor's flattening over
+documents decoded to dicts, to RawBSONDocument, and to dicts after the
+unread fields were projected away as RESEARCH_PAPER_PROJECTION does on
+the server. No server needed.
+
+RawBSONDocument inflates the whole top level on the first field access,
+so with pymongo's C decoder it ran at about 0.56-0.65x the speed of dict
+decoding here, while the projection gave about 1.5x. The extractor
+therefore reads plain dicts and relies on the projection.
+
+    python benchmarks/bench_bson_decoding.py --copies 200
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+import bson
+from bson.codec_options import CodecOptions
+from bson.raw_bson import RawBSONDocument
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from etl_engine.extractors.mongo_extractor import flatten_research_documents
+
+RAW_BSON_CODEC_OPTIONS = CodecOptions(document_class=RawBSONDocument)
+
+SEED_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "faculty_research_papers.json")
+
+
+def build_payload(copies: int, projected: bool = False) -> bytes:
+    """Encode the seed documents copies times, with unread fields added unless projected"""
+    with open(SEED_FILE, "r") as file:
+        seed = json.load(file)
+
+    encoded = []
+    for copy in range(copies):
+        for doc in seed:
+            if not projected:
+                doc = dict(doc, biography="x" * 200, contact={"email": "faculty@example.edu", "office": "Block 9"})
+                doc["papers"] = [dict(paper, abstract="y" * 500, citations=list(range(20))) for paper in doc["papers"]]
+            encoded.append(bson.encode(doc))
+    return b"".join(encoded)
+
+
+def time_flatten(payload: bytes, codec_options: CodecOptions) -> float:
+    start = time.perf_counter()
+    documents = bson.decode_iter(payload, codec_options)
+    rows = sum(len(chunk) for chunk in flatten_research_documents(documents))
+    elapsed = time.perf_counter() - start
+    print(f"  {rows} rows")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--copies", type=int, default=100, help="times to replicate the seed documents")
+    args = parser.parse_args()
+
+    payload = build_payload(args.copies)
+    print(f"Payload: {len(payload) / 1e6:.1f} MB")
+
+    print("dict decoding:")
+    dict_seconds = time_flatten(payload, CodecOptions())
+    print(f"  {dict_seconds:.3f}s")
+
+    print("RawBSONDocument decoding:")
+    raw_seconds = time_flatten(payload, RAW_BSON_CODEC_OPTIONS)
+    print(f"  {raw_seconds:.3f}s")
+
+    projected_payload = build_payload(args.copies, projected=True)
+    print(f"Projected payload: {len(projected_payload) / 1e6:.1f} MB")
+
+    print("dict decoding of projected documents:")
+    projected_seconds = time_flatten(projected_payload, CodecOptions())
+    print(f"  {projected_seconds:.3f}s")
+
+    print(f"RawBSONDocument vs dict: {dict_seconds / raw_seconds:.2f}x")
+    print(f"Projection vs dict: {dict_seconds / projected_seconds:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Cold-start import-time budget check.
+
+Imports each module in a fresh interpreter with `python -X importtime`,
+reports its cumulative import time and the slowest dependencies, and
+exits non-zero when a module exceeds its budget.
+
+    python benchmarks/bench_import_time.py
+    python benchmarks/bench_import_time.py --scale 2.0   # slower machine
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Cumulative import time budgets in milliseconds.
+BUDGETS_MS = {
+    "etl_engine.extractors.base_extractor": 50,
+    "etl_engine.core.config": 350,
+    "etl_engine.extractors.sql_extractor": 1200,
+    "etl_engine.extractors.mongo_extractor": 1000,
+}
+
+
+def measure(module: str, repeat: int):
+    """Return the best cumulative import time (ms) and the slowest imports of the best run"""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [ROOT, env.get("PYTHONPATH")]))
+    # Settings validation needs these to be present, not reachable.
+    env.setdefault("MONGO_DB_URL", "mongodb://localhost:27017")
+    env.setdefault("MONGO_DATABASE", "etl")
+
+    best_ms, best_timings = None, []
+    for _ in range(repeat):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            capture_output=True, text=True, env=env, cwd=ROOT,
+        )
+        if result.returncode != 0:
+            raise RuntimeError(f"import {module} failed:\n{result.stderr[-2000:]}")
+
+        timings = []
+        for line in result.stderr.splitlines():
+            if not line.startswith("import time:") or "cumulative" in line:
+                continue
+            _, self_us, cumulative_us, name = [part.strip() for part in line.replace("import time:", "|").split("|")]
+            timings.append((name, int(self_us) / 1000, int(cumulative_us) / 1000))
+
+        total_ms = next(cumulative for name, _, cumulative in reversed(timings) if name == module)
+        if best_ms is None or total_ms < best_ms:
+            best_ms, best_timings = total_ms, timings
+
+    return best_ms, sorted(best_timings, key=lambda timing: timing[1], reverse=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", type=float, default=1.0, help="multiply every budget by this factor")
+    parser.add_argument("--repeat", type=int, default=3, help="fresh interpreters per module; the best run counts")
+    parser.add_argument("--top", type=int, default=5, help="slowest imports to list per module")
+    args = parser.parse_args()
+
+    over_budget = []
+    for module, budget_ms in BUDGETS_MS.items():
+        budget_ms *= args.scale
+        total_ms, timings = measure(module, args.repeat)
+        status = "ok" if total_ms <= budget_ms else "OVER BUDGET"
+        print(f"{module}: {total_ms:.1f} ms (budget {budget_ms:.0f} ms) {status}")
+        for name, self_ms, _ in timings[:args.top]:
+            print(f"    {self_ms:8.1f} ms self  {name}")
+        if total_ms > budget_ms:
+            over_budget.append(module)
+
+    if over_budget:
+        print(f"Import time budget exceeded by: {', '.join(over_budget)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
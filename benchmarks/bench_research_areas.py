@@ -0,0 +1,75 @@
+"""
+Benchmark the faculty -> research areas mapping against an iterrows loop.
+
+Flattens faculty_research_papers.json with MongoExtractor's flattening,
+replicates the rows and times ResearchTransformer.get_research_areas_by_faculty
+against the row-by-row loop it replaced. Both must produce the same mapping.
+No server needed.
+
+    python benchmarks/bench_research_areas.py --copies 50
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from collections import defaultdict
+
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from etl_engine.extractors.mongo_extractor import flatten_research_documents
+from etl_engine.transformers import ResearchTransformer
+from etl_engine.utils.names import NAME_COLUMNS
+
+SEED_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "faculty_research_papers.json")
+
+
+def build_frame(copies: int) -> pd.DataFrame:
+    with open(SEED_FILE, "r") as file:
+        seed = json.load(file)
+    papers = pd.concat(flatten_research_documents(seed), ignore_index=True)
+    return pd.concat([papers] * copies, ignore_index=True)
+
+
+def iterrows_mapping(research_df: pd.DataFrame) -> dict:
+    """Row-by-row reference: credit the faculty member and every coauthor with the paper's area"""
+    faculty_research = defaultdict(set)
+    for _, row in research_df.iterrows():
+        parts = [row[column] for column in NAME_COLUMNS]
+        own_name = " ".join(p.strip() for p in parts if isinstance(p, str) and p.strip().lower() not in ("", "null"))
+        for author in [own_name] + list(row["coauthors"]):
+            author = " ".join(author.lower().split())
+            if author:
+                faculty_research[author].add(row["research_area"])
+    return faculty_research
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--copies", type=int, default=20, help="times to replicate the seed papers")
+    args = parser.parse_args()
+
+    research_df = build_frame(args.copies)
+    print(f"Papers: {len(research_df)}")
+
+    start = time.perf_counter()
+    expected = iterrows_mapping(research_df)
+    loop_seconds = time.perf_counter() - start
+    print(f"iterrows: {loop_seconds:.3f}s")
+
+    start = time.perf_counter()
+    result = ResearchTransformer.get_research_areas_by_faculty(research_df)
+    vector_seconds = time.perf_counter() - start
+    print(f"explode/groupby: {vector_seconds:.3f}s")
+
+    if {author: set(areas) for author, areas in result.items()} != expected:
+        print("Mappings differ")
+        sys.exit(1)
+    print(f"Authors: {len(result)}, speedup: {loop_seconds / vector_seconds:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+import os
+from typing import Optional
+from motor.motor_asyncio import AsyncIOMotorClient
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from .config import settings
+
+_async_sql_engine: Optional[AsyncEngine] = None
+_motor_client: Optional[AsyncIOMotorClient] = None
+
+
+def get_async_sql_engine() -> AsyncEngine:
+    """Create the shared async engine on first use, with the aiomysql driver"""
+    global _async_sql_engine
+    if _async_sql_engine is None:
+        _async_sql_engine = create_async_engine(make_url(settings.SQL_URL).set(drivername="mysql+aiomysql"))
+    return _async_sql_engine
+
+
+def get_motor_db():
+    """Return the configured database on the shared motor client"""
+    global _motor_client
+    if _motor_client is None:
+        _motor_client = AsyncIOMotorClient(
+            settings.MONGO_URL,
+            serverselectiontimeoutms=3000,
+            connecttimeoutms=3000
+        )
+    return _motor_client[os.getenv("MONGO_DATABASE")]
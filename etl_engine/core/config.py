@@ -1,26 +1,67 @@
 import os
 from dotenv import load_dotenv
+from typing import Dict
 from pydantic_settings import BaseSettings
-from sqlalchemy import URL
-from typing import ClassVar
+from urllib.parse import quote
 
 load_dotenv()
 
 class Settings(BaseSettings):
-    # SQL database config
-    url_object: ClassVar[URL] = URL.create(
-        "mysql+pymysql",
-        username=os.getenv("SQL_USER"),
-        password=os.getenv("SQL_PASSWORD"),
-        host="localhost",
-        database=os.getenv("SQL_DATABASE")
-    )
-    SQL_URL: str = ""
+    # SQL database config. The URL is assembled as a string so importing the
+    # settings does not pull in SQLAlchemy.
+    @property
+    def SQL_URL(self) -> str:
+        username = os.getenv("SQL_USER")
+        password = os.getenv("SQL_PASSWORD")
+        credentials = ""
+        if username:
+            credentials = quote(username, safe="")
+            if password:
+                credentials += ":" + quote(password, safe="")
+            credentials += "@"
+        database = os.getenv("SQL_DATABASE")
+        path = f"/{quote(database, safe='')}" if database else ""
+        return f"mysql+pymysql://{credentials}localhost{path}"
 
     # Mongodb
     MONGO_URL: str = os.getenv("MONGO_DB_URL")
 
-    def model_post_init(self, __context) -> None:
-        object.__setattr__(self, "SQL_URL", self.url_object)
+    # Connection pools
+    SQL_POOL_SIZE: int = 5
+    SQL_MAX_OVERFLOW: int = 10
+    MONGO_POOL_SIZE: int = 10
+    POOL_IDLE_TIMEOUT_SECONDS: int = 300
+
+    # Extraction
+    EXTRACT_CHUNK_SIZE: int = 10000
+    EXTRACT_MAX_WORKERS: int = 4
+    EXTRACT_PARTITION_ROWS: int = 100000
+    EXTRACT_MAX_CONCURRENT_SOURCES: int = 4
+    MONGO_BATCH_SIZE: int = 5000
+    MONGO_SPLIT_SAMPLES_PER_PARTITION: int = 20
+    # Semi-join scoping: key sets up to MONGO_SEMI_JOIN_MAX_IN_KEYS are sent as
+    # $in filters of MONGO_SEMI_JOIN_IN_BATCH keys, larger ones as a Bloom filter.
+    MONGO_SEMI_JOIN_IN_BATCH: int = 1000
+    MONGO_SEMI_JOIN_MAX_IN_KEYS: int = 20000
+    MONGO_SEMI_JOIN_BLOOM_ERROR_RATE: float = 0.01
+    EXTRACT_STATE_DIR: str = ".etl_state"
+    CSV_RANGE_BYTES: int = 64 * 1024 * 1024
+    EXTRACT_CACHE_ENABLED: bool = False
+    EXTRACT_CACHE_DIR: str = ".etl_cache"
+    EXTRACT_CACHE_TTL_SECONDS: int = 24 * 60 * 60
+    EXTRACT_CACHE_MAX_BYTES: int = 1024 * 1024 * 1024
+
+    # Low-cardinality columns are extracted as categoricals. Keys are column
+    # names, values the dictionary they share across sources and chunks.
+    EXTRACT_CATEGORICAL: bool = True
+    CATEGORICAL_COLUMNS: Dict[str, str] = {
+        "department": "department",
+        "department_name": "department",
+        "school": "school",
+        "school_name": "school",
+        "position": "position",
+        "journal": "journal",
+        "research_area": "research_area",
+    }
 
 settings = Settings()
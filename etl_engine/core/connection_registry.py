@@ -0,0 +1,236 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Dict, Optional
+from pydantic import BaseModel, Field
+from .config import settings
+
+# SQLAlchemy and pymongo are only imported once a source of that kind is
+# first borrowed, so Mongo-only or SQL-only workers skip the other one.
+if TYPE_CHECKING:
+    from pymongo import MongoClient
+    from sqlalchemy.engine import Engine
+
+
+class DataSourceConfig(BaseModel):
+    kind: str  # "sql" or "mongo"
+    url: Any = Field(repr=False)
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_pre_ping: bool = True
+    # Pooled connections are recycled after this long, and a source left
+    # unused for this long is disposed by evict_idle().
+    idle_timeout_seconds: int = 300
+
+
+class _PoolCounters:
+    """Connection lifecycle counters, fed by SQLAlchemy pool events or pymongo pool monitoring"""
+
+    def __init__(self):
+        self.connects = 0
+        self.checkouts = 0
+        self.closed = 0
+
+
+def _mongo_pool_listener(counters: _PoolCounters):
+    """Wrap counters in a pymongo ConnectionPoolListener"""
+    from pymongo import monitoring
+
+    class MongoPoolListener(monitoring.ConnectionPoolListener):
+        def connection_created(self, event):
+            counters.connects += 1
+
+        def connection_checked_out(self, event):
+            counters.checkouts += 1
+
+        def connection_closed(self, event):
+            counters.closed += 1
+
+        # The remaining pool events are not counted.
+        def pool_created(self, event):
+            pass
+
+        def pool_ready(self, event):
+            pass
+
+        def pool_cleared(self, event):
+            pass
+
+        def pool_closed(self, event):
+            pass
+
+        def connection_ready(self, event):
+            pass
+
+        def connection_check_out_started(self, event):
+            pass
+
+        def connection_check_out_failed(self, event):
+            pass
+
+        def connection_checked_in(self, event):
+            pass
+
+    return MongoPoolListener()
+
+
+class ConnectionRegistry:
+    """Lazily creates one pooled SQL engine or MongoClient per configured data source"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._configs: Dict[str, DataSourceConfig] = {}
+        self._connections: Dict[str, Any] = {}
+        self._counters: Dict[str, _PoolCounters] = {}
+        self._last_used: Dict[str, float] = {}
+
+    def register(self, name: str, kind: str, url: Any, **pool_options) -> None:
+        """Describe a data source; nothing connects until it is first borrowed"""
+        config = DataSourceConfig(kind=kind, url=url, **pool_options)
+        with self._lock:
+            if name in self._connections and self._configs[name] != config:
+                self._dispose(name)
+            self._configs[name] = config
+
+    def is_registered(self, name: str) -> bool:
+        return name in self._configs
+
+    def get_engine(self, name: str) -> "Engine":
+        return self._get(name, "sql")
+
+    def get_mongo_client(self, name: str) -> "MongoClient":
+        return self._get(name, "mongo")
+
+    @contextmanager
+    def session(self, name: str):
+        """Borrow a pooled connection from the named SQL source as an ORM session"""
+        from sqlalchemy.orm import sessionmaker
+
+        db = sessionmaker(autocommit=False, autoflush=False, bind=self.get_engine(name))()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    def evict_idle(self, max_idle_seconds: Optional[float] = None) -> list:
+        """Dispose engines/clients that have not been borrowed for max_idle_seconds"""
+        now = time.time()
+        evicted = []
+        with self._lock:
+            for name in list(self._connections):
+                limit = max_idle_seconds if max_idle_seconds is not None else self._configs[name].idle_timeout_seconds
+                if now - self._last_used.get(name, now) > limit:
+                    self._dispose(name)
+                    evicted.append(name)
+        return evicted
+
+    def dispose(self, name: Optional[str] = None) -> None:
+        with self._lock:
+            for source in [name] if name else list(self._connections):
+                if source in self._connections:
+                    self._dispose(source)
+
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Pool usage per live data source"""
+        result = {}
+        with self._lock:
+            for name, connection in self._connections.items():
+                counters = self._counters[name]
+                source_metrics = {
+                    "kind": self._configs[name].kind,
+                    "connects": counters.connects,
+                    "checkouts": counters.checkouts,
+                    "closed": counters.closed,
+                    "idle_seconds": round(time.time() - self._last_used[name], 3),
+                }
+                pool = getattr(connection, "pool", None)
+                if self._configs[name].kind == "sql" and hasattr(pool, "overflow"):
+                    source_metrics.update({
+                        "pool_size": pool.size(),
+                        "checked_out": pool.checkedout(),
+                        "checked_in": pool.checkedin(),
+                        "overflow": pool.overflow(),
+                    })
+                result[name] = source_metrics
+        return result
+
+    def _get(self, name: str, kind: str):
+        with self._lock:
+            if name not in self._configs:
+                raise KeyError(f"Data source '{name}' is not registered")
+            config = self._configs[name]
+            if config.kind != kind:
+                raise ValueError(f"Data source '{name}' is a {config.kind} source, not {kind}")
+
+            if name not in self._connections:
+                self._counters[name] = _PoolCounters()
+                if kind == "sql":
+                    self._connections[name] = self._create_engine(config, self._counters[name])
+                else:
+                    self._connections[name] = self._create_mongo_client(config, self._counters[name])
+
+            self._last_used[name] = time.time()
+            return self._connections[name]
+
+    @staticmethod
+    def _create_engine(config: DataSourceConfig, counters: _PoolCounters) -> "Engine":
+        from sqlalchemy import create_engine, event
+        from sqlalchemy.engine import make_url
+
+        options = {"pool_pre_ping": config.pool_pre_ping, "pool_recycle": config.idle_timeout_seconds}
+        url = make_url(config.url)
+        # In-memory SQLite uses SingletonThreadPool, which takes no size
+        # options; file-based SQLite gets a QueuePool like any other database.
+        in_memory = url.get_backend_name() == "sqlite" and (
+            url.database in (None, "", ":memory:") or url.query.get("mode") == "memory"
+        )
+        if not in_memory:
+            options.update(pool_size=config.pool_size, max_overflow=config.max_overflow)
+        engine = create_engine(config.url, **options)
+
+        def count(attribute):
+            def listener(*args):
+                setattr(counters, attribute, getattr(counters, attribute) + 1)
+            return listener
+
+        event.listen(engine.pool, "connect", count("connects"))
+        event.listen(engine.pool, "checkout", count("checkouts"))
+        event.listen(engine.pool, "close", count("closed"))
+        return engine
+
+    @staticmethod
+    def _create_mongo_client(config: DataSourceConfig, counters: _PoolCounters) -> "MongoClient":
+        from pymongo import MongoClient
+
+        return MongoClient(
+            config.url,
+            maxPoolSize=config.pool_size + config.max_overflow,
+            minPoolSize=0,
+            maxIdleTimeMS=config.idle_timeout_seconds * 1000,
+            serverselectiontimeoutms=3000,
+            connecttimeoutms=3000,
+            event_listeners=[_mongo_pool_listener(counters)],
+        )
+
+    def _dispose(self, name: str) -> None:
+        connection = self._connections.pop(name)
+        if self._configs[name].kind == "sql":
+            connection.dispose()
+        else:
+            connection.close()
+        self._last_used.pop(name, None)
+
+
+registry = ConnectionRegistry()
+registry.register(
+    "default_sql", "sql", settings.SQL_URL,
+    pool_size=settings.SQL_POOL_SIZE,
+    max_overflow=settings.SQL_MAX_OVERFLOW,
+    idle_timeout_seconds=settings.POOL_IDLE_TIMEOUT_SECONDS,
+)
+registry.register(
+    "default_mongo", "mongo", settings.MONGO_URL,
+    pool_size=settings.MONGO_POOL_SIZE,
+    max_overflow=0,
+    idle_timeout_seconds=settings.POOL_IDLE_TIMEOUT_SECONDS,
+)
@@ -0,0 +1,190 @@
+import hashlib
+import importlib.util
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+import pandas as pd
+from .config import settings
+
+
+class ExtractionCache:
+    """On-disk Parquet cache of extracted frames, keyed by source, query and source fingerprint
+
+    An entry is only reused while the fingerprint (e.g. row count plus max
+    key) is unchanged and it is younger than ttl_seconds. When the cache
+    grows past max_bytes the least recently used entries are evicted.
+    Entries are Parquet files, so pyarrow must be installed.
+
+    Each entry keeps its metadata in its own small JSON file next to the
+    Parquet file, and eviction sizes the directory from the Parquet files
+    themselves. Several processes can share one cache directory without a
+    shared index whose updates they could overwrite.
+    """
+
+    DATA_SUFFIX = ".parquet"
+    META_SUFFIX = ".json"
+
+    def __init__(self, path: Optional[str] = None, ttl_seconds: Optional[int] = None,
+                 max_bytes: Optional[int] = None):
+        if importlib.util.find_spec("pyarrow") is None:
+            raise ImportError("ExtractionCache requires pyarrow: pip install pyarrow")
+        self.path = path or settings.EXTRACT_CACHE_DIR
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else settings.EXTRACT_CACHE_TTL_SECONDS
+        self.max_bytes = max_bytes if max_bytes is not None else settings.EXTRACT_CACHE_MAX_BYTES
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "expired": 0, "evictions": 0}
+        os.makedirs(self.path, exist_ok=True)
+
+    def get_or_extract(self, source: str, query: str, fingerprint: Any,
+                       extract: Callable[[], pd.DataFrame], arrow_lists: bool = False) -> pd.DataFrame:
+        """Return the cached frame for an unchanged source, otherwise extract and store it"""
+        key = self.make_key(source, query, fingerprint)
+        df = self.get(key, arrow_lists)
+        if df is not None:
+            return df
+
+        df = extract()
+        if not df.empty:
+            self.put(key, df)
+        return df
+
+    @staticmethod
+    def make_key(source: str, query: str, fingerprint: Any) -> str:
+        payload = json.dumps([source, query, fingerprint], sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def get(self, key: str, arrow_lists: bool = False) -> Optional[pd.DataFrame]:
+        """Cached frame for key, or None; list columns are Arrow list arrays with arrow_lists, else Python lists"""
+        entry = self._read_meta(key)
+        if entry is not None and self.ttl_seconds and time.time() - entry["created_at"] > self.ttl_seconds:
+            self._remove(key)
+            self._count("expired")
+            entry = None
+
+        if entry is not None:
+            entry["last_access"] = time.time()
+            self._write_meta(key, entry)
+            try:
+                df = self._read_frame(self._data_path(key), arrow_lists)
+            except FileNotFoundError:
+                df = None  # evicted by another process in the meantime
+            if df is not None:
+                self._count("hits")
+                return df
+
+        self._count("misses")
+        return None
+
+    def put(self, key: str, df: pd.DataFrame) -> None:
+        file_path = self._data_path(key)
+        temp_path = self._temp_path(file_path)
+        df.to_parquet(temp_path, index=False)
+        os.replace(temp_path, file_path)
+
+        now = time.time()
+        self._write_meta(key, {"size": os.path.getsize(file_path), "created_at": now, "last_access": now})
+        self._evict(keep=key)
+
+    def clear(self) -> None:
+        for key in self._entries():
+            self._remove(key)
+
+    def reset_stats(self) -> None:
+        self.stats = {name: 0 for name in self.stats}
+
+    def report(self) -> str:
+        lookups = self.stats["hits"] + self.stats["misses"]
+        hit_rate = self.stats["hits"] / lookups if lookups else 0.0
+        return (f"cache hits: {self.stats['hits']}, misses: {self.stats['misses']} "
+                f"(expired: {self.stats['expired']}), evictions: {self.stats['evictions']}, "
+                f"hit rate: {hit_rate:.0%}")
+
+    @staticmethod
+    def _read_frame(file_path: str, arrow_lists: bool) -> pd.DataFrame:
+        """Read an entry back with the column types the extractor produced"""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        table = pq.read_table(file_path)
+        # Parquet would read text stored from object columns back as str, and
+        # lists as arrays; rebuild those as the Python objects they were.
+        python_columns = [
+            column["name"] for column in (table.schema.pandas_metadata or {}).get("columns", [])
+            if column["pandas_type"] == "unicode" and column["numpy_type"] == "object"
+        ]
+        if not arrow_lists:
+            python_columns += [field.name for field in table.schema if pa.types.is_list(field.type)]
+        python_columns = [name for name in python_columns if name in table.column_names]
+
+        df = table.drop_columns(python_columns).to_pandas(
+            types_mapper=lambda dtype: pd.ArrowDtype(pa.list_(dtype.value_type)) if pa.types.is_list(dtype) else None
+        )
+        for name in python_columns:
+            df[name] = pd.Series(table.column(name).to_pylist(), index=df.index, dtype=object)
+        return df[table.column_names]
+
+    def _evict(self, keep: str) -> None:
+        """Drop least recently used entries until the cache fits in max_bytes"""
+        entries = self._entries()
+        total = sum(size for size, _ in entries.values())
+        for key in sorted(entries, key=lambda k: entries[k][1]):
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            total -= entries[key][0]
+            self._remove(key)
+            self._count("evictions")
+
+    def _entries(self) -> Dict[str, Tuple[int, float]]:
+        """Size and last access of every entry on disk, whichever process wrote it"""
+        entries = {}
+        for name in os.listdir(self.path):
+            if not name.endswith(self.DATA_SUFFIX):
+                continue
+            key = name[:-len(self.DATA_SUFFIX)]
+            try:
+                stat = os.stat(os.path.join(self.path, name))
+            except FileNotFoundError:
+                continue
+            entry = self._read_meta(key)
+            entries[key] = (stat.st_size, entry["last_access"] if entry else stat.st_mtime)
+        return entries
+
+    def _remove(self, key: str) -> None:
+        for file_path in (self._data_path(key), self._meta_path(key)):
+            try:
+                os.remove(file_path)
+            except FileNotFoundError:
+                pass
+
+    def _read_meta(self, key: str) -> Optional[dict]:
+        try:
+            with open(self._meta_path(key), "r") as file:
+                return json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def _write_meta(self, key: str, entry: dict) -> None:
+        meta_path = self._meta_path(key)
+        temp_path = self._temp_path(meta_path)
+        with open(temp_path, "w") as file:
+            json.dump(entry, file)
+        os.replace(temp_path, meta_path)
+
+    def _count(self, stat: str) -> None:
+        with self._lock:
+            self.stats[stat] += 1
+
+    def _data_path(self, key: str) -> str:
+        return os.path.join(self.path, f"{key}{self.DATA_SUFFIX}")
+
+    def _meta_path(self, key: str) -> str:
+        return os.path.join(self.path, f"{key}{self.META_SUFFIX}")
+
+    @staticmethod
+    def _temp_path(file_path: str) -> str:
+        # Unique per process and thread, so concurrent writers never share a temp file.
+        return f"{file_path}.{os.getpid()}.{threading.get_ident()}.tmp"
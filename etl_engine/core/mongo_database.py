@@ -1,19 +1,18 @@
-from pymongo import MongoClient
 from contextlib import contextmanager
 from dotenv import load_dotenv
 import os
-from .config import settings
+from .connection_registry import registry
 
 load_dotenv()
 
-client = MongoClient(
-    settings.MONGO_URL,
-    serverselectiontimeoutms=3000,
-    connecttimeoutms=3000
-)
+DEFAULT_MONGO_SOURCE = "default_mongo"
+
+
+def get_mongo_client(source: str = DEFAULT_MONGO_SOURCE):
+    return registry.get_mongo_client(source)
 
 
 @contextmanager
-def get_mongo_db():
-    db = client[os.getenv("MONGO_DATABASE")]
+def get_mongo_db(source: str = DEFAULT_MONGO_SOURCE):
+    db = get_mongo_client(source)[os.getenv("MONGO_DATABASE")]
     yield db
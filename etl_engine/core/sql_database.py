@@ -1,18 +1,16 @@
-from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
 from contextlib import contextmanager
-from .config import settings
+from .connection_registry import registry
 
-sql_engine = create_engine(settings.SQL_URL)
-session_local = sessionmaker(autocommit=False, autoflush=False, bind=sql_engine)
+DEFAULT_SQL_SOURCE = "default_sql"
 Base = declarative_base()
 
 
+def get_sql_engine(source: str = DEFAULT_SQL_SOURCE):
+    return registry.get_engine(source)
+
+
 @contextmanager
-def get_sql_db():
-    db = session_local()
-    try:
+def get_sql_db(source: str = DEFAULT_SQL_SOURCE):
+    with registry.session(source) as db:
         yield db
-    finally:
-        db.close()
@@ -0,0 +1,97 @@
+import json
+import os
+import threading
+from datetime import datetime
+from typing import Any, Optional
+import pandas as pd
+from .config import settings
+
+
+class ExtractionStateStore:
+    """Local store for incremental-extraction watermarks and snapshots, keyed by job and source"""
+
+    WATERMARK_FILE = "watermarks.json"
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or settings.EXTRACT_STATE_DIR
+        self._lock = threading.Lock()
+        os.makedirs(self.path, exist_ok=True)
+
+    def get_watermark(self, job: str, source: str) -> Optional[Any]:
+        """Return the last watermark recorded for job/source, or None on the first run"""
+        with self._lock:
+            entry = self._read_watermarks().get(self._key(job, source))
+        return self._decode(entry) if entry else None
+
+    def set_watermark(self, job: str, source: str, value: Any) -> None:
+        with self._lock:
+            watermarks = self._read_watermarks()
+            watermarks[self._key(job, source)] = self._encode(value)
+            self._write_atomic(os.path.join(self.path, self.WATERMARK_FILE), json.dumps(watermarks, indent=2))
+
+    def load_snapshot(self, job: str, source: str) -> Optional[pd.DataFrame]:
+        """Return the merged frame saved by the previous run, if any"""
+        snapshot_path = self._snapshot_path(job, source)
+        if not os.path.exists(snapshot_path):
+            return None
+        return pd.read_pickle(snapshot_path)
+
+    def save_snapshot(self, job: str, source: str, df: pd.DataFrame) -> None:
+        snapshot_path = self._snapshot_path(job, source)
+        temp_path = f"{snapshot_path}.tmp"
+        df.to_pickle(temp_path)
+        os.replace(temp_path, snapshot_path)
+
+    def reset(self, job: str, source: str) -> None:
+        """Forget the watermark and snapshot so the next run is a full extract"""
+        with self._lock:
+            watermarks = self._read_watermarks()
+            watermarks.pop(self._key(job, source), None)
+            self._write_atomic(os.path.join(self.path, self.WATERMARK_FILE), json.dumps(watermarks, indent=2))
+        if os.path.exists(self._snapshot_path(job, source)):
+            os.remove(self._snapshot_path(job, source))
+
+    @staticmethod
+    def _key(job: str, source: str) -> str:
+        return f"{job}/{source}"
+
+    def _snapshot_path(self, job: str, source: str) -> str:
+        safe_name = "".join(c if c.isalnum() or c in "-_." else "_" for c in self._key(job, source))
+        return os.path.join(self.path, f"{safe_name}.pkl")
+
+    def _read_watermarks(self) -> dict:
+        watermark_path = os.path.join(self.path, self.WATERMARK_FILE)
+        if not os.path.exists(watermark_path):
+            return {}
+        with open(watermark_path, "r") as file:
+            return json.load(file)
+
+    @staticmethod
+    def _write_atomic(path: str, content: str) -> None:
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "w") as file:
+            file.write(content)
+        os.replace(temp_path, path)
+
+    @staticmethod
+    def _encode(value: Any) -> dict:
+        """Tag watermark values so ObjectIds and timestamps survive the JSON round trip"""
+        from bson import ObjectId
+
+        if isinstance(value, ObjectId):
+            return {"type": "objectid", "value": str(value)}
+        if isinstance(value, (datetime, pd.Timestamp)):
+            return {"type": "datetime", "value": value.isoformat()}
+        if hasattr(value, "item"):
+            # numpy scalars from DataFrame reductions
+            value = value.item()
+        return {"type": "value", "value": value}
+
+    @staticmethod
+    def _decode(entry: dict) -> Any:
+        if entry["type"] == "objectid":
+            from bson import ObjectId
+            return ObjectId(entry["value"])
+        if entry["type"] == "datetime":
+            return datetime.fromisoformat(entry["value"])
+        return entry["value"]
@@ -0,0 +1,34 @@
+from abc import ABC, abstractmethod
+from typing import AsyncIterator
+import pandas as pd
+
+
+class AsyncBaseExtractor(ABC):
+    """Async counterpart of BaseExtractor, for callers running on an event loop"""
+
+    def __init__(self):
+        self.connection = None
+
+    @abstractmethod
+    async def connect(self) -> bool:
+        """Check that the source is reachable without blocking the event loop"""
+        pass
+
+    @abstractmethod
+    async def extract(self):
+        """Extract data based on user configuration"""
+        pass
+
+    @abstractmethod
+    def extract_iter(self, chunk_size: int) -> AsyncIterator[pd.DataFrame]:
+        """Extract data as an async stream of DataFrame chunks of at most chunk_size rows
+
+        A failure part-way through is reported and re-raised, so a stream that
+        ends normally is always complete.
+        """
+        pass
+
+    async def disconnect(self):
+        """Close connection"""
+        if self.connection:
+            await self.connection.close()
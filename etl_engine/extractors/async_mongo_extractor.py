@@ -0,0 +1,54 @@
+import asyncio
+from typing import AsyncIterator, Optional
+import pandas as pd
+from .async_base_extractor import AsyncBaseExtractor
+from .mongo_extractor import RESEARCH_PAPER_PROJECTION, flatten_research_documents
+from etl_engine.core.async_database import get_motor_db
+from etl_engine.core.config import settings
+from etl_engine.utils.categoricals import CategoryDictionary, concat_frames, encode_frame, resolve_categories
+
+
+class AsyncMongoExtractor(AsyncBaseExtractor):
+    def __init__(self, db=None, categories: Optional[CategoryDictionary] = None):
+        super().__init__()
+        # Low-cardinality columns are emitted dictionary-encoded; pass one
+        # CategoryDictionary to several extractors to share the codes.
+        self.categories = resolve_categories(categories)
+        # Any motor database works; defaults to the configured one.
+        self.db = db if db is not None else get_motor_db()
+
+    async def connect(self) -> bool:
+        try:
+            await self.db.command("ping")
+            return True
+        except Exception as e:
+            print(f"Connection failed: {e}")
+            return False
+
+    async def extract(self, batch_size: Optional[int] = None) -> pd.DataFrame:
+        try:
+            chunks = [chunk async for chunk in self.extract_iter(batch_size=batch_size)]
+        except Exception:
+            # extract_iter already reported the failure.
+            return pd.DataFrame()
+        df = concat_frames(chunks, self.categories)
+        if df.empty:
+            print("No research paper data found.")
+        return df
+
+    async def extract_iter(self, chunk_size: Optional[int] = None, batch_size: Optional[int] = None) -> AsyncIterator[pd.DataFrame]:
+        """Stream flattened research papers, flattening one batch while the next is fetched"""
+        chunk_size = chunk_size or settings.EXTRACT_CHUNK_SIZE
+        batch_size = batch_size or settings.MONGO_BATCH_SIZE
+
+        try:
+            cursor = self.db.research_papers_v2.find({}, RESEARCH_PAPER_PROJECTION, batch_size=batch_size)
+            documents = await cursor.to_list(length=batch_size)
+            while documents:
+                next_batch = asyncio.ensure_future(cursor.to_list(length=batch_size))
+                for chunk in flatten_research_documents(documents, chunk_size):
+                    yield encode_frame(chunk, self.categories)
+                documents = await next_batch
+        except Exception as e:
+            print(f"Chunked extraction of research papers failed: {e}")
+            raise
@@ -0,0 +1,70 @@
+import asyncio
+from typing import AsyncIterator, Optional
+import pandas as pd
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+from .async_base_extractor import AsyncBaseExtractor
+from .sql_extractor import build_columnar_frame, core_select, get_table_model
+from etl_engine.core.async_database import get_async_sql_engine
+from etl_engine.core.config import settings
+from etl_engine.models.faculty_model import Faculty
+from etl_engine.utils.categoricals import CategoryDictionary, encode_frame, resolve_categories
+
+
+class AsyncSQLExtractor(AsyncBaseExtractor):
+    def __init__(self, engine: Optional[AsyncEngine] = None, use_arrow: bool = False,
+                 categories: Optional[CategoryDictionary] = None):
+        super().__init__()
+        # Low-cardinality columns are emitted dictionary-encoded; pass one
+        # CategoryDictionary to several extractors to share the codes.
+        self.categories = resolve_categories(categories)
+        # Any async engine works, e.g. sqlite+aiosqlite for local runs.
+        self.engine = engine or get_async_sql_engine()
+        self.use_arrow = use_arrow
+
+    async def connect(self) -> bool:
+        try:
+            async with self.engine.connect() as conn:
+                result = await conn.execute(text("SELECT 1;"))
+                _ = result.fetchone()
+            return True
+        except Exception as e:
+            print(f"Connection failed: {e}")
+            return False
+
+    async def extract(self) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+        # The three tables are independent, so their queries run concurrently.
+        faculty_df, department_df, school_df = await asyncio.gather(
+            self.extract_table("faculties"),
+            self.extract_table("departments"),
+            self.extract_table("schools"),
+        )
+        return faculty_df, department_df, school_df
+
+    async def extract_table(self, table: str) -> pd.DataFrame:
+        model = get_table_model(table)
+        try:
+            async with self.engine.connect() as conn:
+                result = await conn.execute(core_select(model))
+                rows = result.all()
+            return encode_frame(build_columnar_frame(model, rows, self.use_arrow), self.categories)
+        except Exception as e:
+            print(f"Extraction of {table} failed: {e}")
+            return pd.DataFrame()
+
+    async def extract_iter(self, chunk_size: Optional[int] = None, table: str = Faculty.__tablename__) -> AsyncIterator[pd.DataFrame]:
+        """Stream a table as DataFrame chunks through a server-side cursor"""
+        model = get_table_model(table)
+        chunk_size = chunk_size or settings.EXTRACT_CHUNK_SIZE
+
+        try:
+            async with self.engine.connect() as conn:
+                result = await conn.stream(core_select(model).execution_options(yield_per=chunk_size))
+                async for rows in result.partitions(chunk_size):
+                    yield encode_frame(build_columnar_frame(model, rows, self.use_arrow), self.categories)
+        except Exception as e:
+            print(f"Chunked extraction of {table} failed: {e}")
+            raise
+
+    async def disconnect(self):
+        await self.engine.dispose()
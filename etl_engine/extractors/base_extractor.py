@@ -1,13 +1,26 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any
-import pandas as pd
-from security.credential_vault import CredentialVault
+from typing import TYPE_CHECKING, Dict, Any, Iterator, Optional
+
+# pandas and cryptography are heavy imports; only load them when needed.
+if TYPE_CHECKING:
+    import pandas as pd
+    from security.credential_vault import CredentialVault
 
 
 class BaseExtractor(ABC):
-    def __init__(self):
+    def __init__(self, data_source: Optional[str] = None):
         self.connection = None
-        self.credential_vault = CredentialVault()
+        # Name of the connection registry entry this extractor borrows from.
+        self.data_source = data_source
+        self._credential_vault = None
+
+    @property
+    def credential_vault(self) -> "CredentialVault":
+        """Vault for user-provided credentials, created on first use"""
+        if self._credential_vault is None:
+            from security.credential_vault import CredentialVault
+            self._credential_vault = CredentialVault()
+        return self._credential_vault
 
     @abstractmethod
     def connect(self):
@@ -19,6 +32,15 @@ class BaseExtractor(ABC):
         """Extract data based on user configuration"""
         pass
 
+    @abstractmethod
+    def extract_iter(self, chunk_size: int) -> Iterator["pd.DataFrame"]:
+        """Extract data as a stream of DataFrame chunks of at most chunk_size rows
+
+        A failure part-way through is reported and re-raised, so a stream that
+        ends normally is always complete.
+        """
+        pass
+
     def validate_permissions(self) -> bool:
         """Ensure user has read permissions"""
         try:
@@ -0,0 +1,196 @@
+import csv
+import io
+import math
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+import pandas as pd
+from .file_extractor import FileExtractor
+from etl_engine.core.config import settings
+from etl_engine.utils.categoricals import CategoryDictionary, concat_frames, encode_frame, resolve_categories
+
+SAMPLE_BYTES = 64 * 1024
+
+
+def plan_byte_ranges(path: str, data_start: int, range_bytes: int) -> List[Tuple[int, int]]:
+    """Split the data section of a file into [start, end) ranges that end on a newline"""
+    size = os.path.getsize(path)
+    if data_start >= size:
+        return []
+
+    partitions = max(1, math.ceil((size - data_start) / range_bytes))
+    boundaries = [data_start]
+    with open(path, "rb") as file:
+        for i in range(1, partitions):
+            file.seek(max(data_start + i * range_bytes, boundaries[-1]))
+            file.readline()  # move to the start of the next record
+            offset = file.tell()
+            if offset >= size:
+                break
+            if offset > boundaries[-1]:
+                boundaries.append(offset)
+    boundaries.append(size)
+
+    return list(zip(boundaries[:-1], boundaries[1:]))
+
+
+class SchemaMismatchError(ValueError):
+    """A byte range holds values that do not fit the schema inferred from the sample"""
+
+    def __init__(self, changed: Dict[str, Any]):
+        super().__init__(f"Column types changed after the sampled rows: {', '.join(changed)}")
+        self.changed = changed
+
+    def __reduce__(self):
+        return type(self), (self.changed,)
+
+
+def parse_byte_range(path: str, byte_range: Tuple[int, int], names: List[str],
+                     dtypes: Optional[Dict[str, Any]], sep: str) -> pd.DataFrame:
+    """Parse one record-aligned byte range; runs inside a worker process"""
+    start, end = byte_range
+    with open(path, "rb") as file:
+        file.seek(start)
+        data = file.read(end - start)
+    try:
+        return pd.read_csv(io.BytesIO(data), header=None, names=names, dtype=dtypes, sep=sep)
+    except ValueError:
+        if not dtypes:
+            raise
+        # Report which columns the range infers differently, so the caller can widen them.
+        frame = pd.read_csv(io.BytesIO(data), header=None, names=names, sep=sep)
+        changed = {name: frame[name].dtype for name, dtype in dtypes.items()
+                   if name in frame.columns and frame[name].dtype != dtype}
+        if not changed:
+            raise
+        raise SchemaMismatchError(changed)
+
+
+def widen_dtype(current: Any, found: Any) -> Any:
+    """Smallest dtype holding both: float64 for mixed numbers, text otherwise"""
+    if pd.api.types.is_numeric_dtype(current) and pd.api.types.is_numeric_dtype(found) \
+            and not pd.api.types.is_bool_dtype(current) and not pd.api.types.is_bool_dtype(found):
+        return "float64"
+    return "str"
+
+
+class CSVExtractor(FileExtractor):
+    """Parse a large CSV file as byte ranges in a process pool
+
+    Ranges are cut on newlines, so fields must not contain quoted line
+    breaks (files written by csv_loader never do). Column types not given
+    in dtypes are inferred once from the first rows and applied to every
+    range, so all ranges share one schema.
+    """
+
+    def __init__(self, path: str, dtypes: Optional[Dict[str, str]] = None, sep: str = ",",
+                 max_workers: Optional[int] = None, categories: Optional[CategoryDictionary] = None):
+        super().__init__(path)
+        # Low-cardinality columns are emitted dictionary-encoded, like the database extractors do.
+        self.categories = resolve_categories(categories)
+        self.dtypes = dtypes
+        self.sep = sep
+        self.max_workers = max_workers or os.cpu_count() or 1
+
+    def extract(self) -> pd.DataFrame:
+        try:
+            names, data_start = self.__read_header()
+            # At least one range per worker, so every core gets work.
+            data_bytes = os.path.getsize(self.path) - data_start
+            range_bytes = max(1, min(settings.CSV_RANGE_BYTES, math.ceil(data_bytes / self.max_workers)))
+            ranges = plan_byte_ranges(self.path, data_start, range_bytes)
+            schema = self.__infer_schema(names, data_start)
+            while True:
+                try:
+                    frames = list(self.__parse_ranges(names, ranges, schema))
+                    break
+                except SchemaMismatchError as e:
+                    # A later range disagrees with the sample: widen those columns and parse again.
+                    if any(name in (self.dtypes or {}) for name in e.changed):
+                        raise
+                    schema = {**schema, **{name: widen_dtype(schema[name], dtype) for name, dtype in e.changed.items()}}
+
+            df = concat_frames(frames, self.categories)
+            if not df.empty:
+                return df
+            return pd.DataFrame({name: pd.Series(dtype=(self.dtypes or {}).get(name, "object")) for name in names})
+        except Exception as e:
+            print(f"Extraction of {self.path} failed: {e}")
+            return pd.DataFrame()
+
+    def extract_iter(self, chunk_size: Optional[int] = None) -> Iterator[pd.DataFrame]:
+        """Stream the file in order as chunks of roughly chunk_size rows
+
+        Chunks already yielded cannot be re-read, so inferred integer and
+        boolean columns use the nullable Int64 and boolean dtypes, letting a
+        later empty cell through. A column whose values change type after the
+        sampled rows still fails the stream; pass dtypes for it.
+        """
+        chunk_size = chunk_size or settings.EXTRACT_CHUNK_SIZE
+
+        try:
+            names, data_start = self.__read_header()
+            range_bytes = max(1, chunk_size * self.__estimate_row_bytes(data_start))
+            schema = self.__infer_schema(names, data_start, nullable=True)
+            yield from self.__parse_ranges(names, plan_byte_ranges(self.path, data_start, range_bytes), schema)
+        except Exception as e:
+            print(f"Chunked extraction of {self.path} failed: {e}")
+            raise
+
+    def __parse_ranges(self, names: List[str], ranges: List[Tuple[int, int]],
+                       schema: Dict[str, Any]) -> Iterator[pd.DataFrame]:
+        """Parse ranges in parallel and yield them in file order, with bounded read-ahead"""
+        if not ranges:
+            return
+
+        with ProcessPoolExecutor(max_workers=min(self.max_workers, len(ranges))) as executor:
+            pending = deque()
+            ranges = iter(ranges)
+            for byte_range in ranges:
+                pending.append(executor.submit(parse_byte_range, self.path, byte_range, names, schema, self.sep))
+                if len(pending) >= 2 * self.max_workers:
+                    break
+
+            while pending:
+                frame = pending.popleft().result()
+                next_range = next(ranges, None)
+                if next_range is not None:
+                    pending.append(executor.submit(parse_byte_range, self.path, next_range, names, schema, self.sep))
+                yield encode_frame(frame, self.categories)
+
+    def __read_header(self) -> Tuple[List[str], int]:
+        with open(self.path, "rb") as file:
+            header = file.readline()
+            data_start = file.tell()
+        names = next(csv.reader([header.decode("utf-8-sig")], delimiter=self.sep), [])
+        return names, data_start
+
+    def __infer_schema(self, names: List[str], data_start: int, nullable: bool = False) -> Dict[str, Any]:
+        """Column dtypes of the first rows, with the caller's dtypes taking precedence
+
+        With nullable, inferred integer and boolean columns get the nullable
+        Int64 and boolean dtypes.
+        """
+        with open(self.path, "rb") as file:
+            file.seek(data_start)
+            sample = file.read(SAMPLE_BYTES) + file.readline()  # finish the last sampled row
+        if not sample.strip():
+            return dict(self.dtypes or {})
+        frame = pd.read_csv(io.BytesIO(sample), header=None, names=names, dtype=self.dtypes, sep=self.sep)
+        schema = frame.dtypes.to_dict()
+        if nullable:
+            for name, dtype in schema.items():
+                if name in (self.dtypes or {}):
+                    continue
+                if pd.api.types.is_bool_dtype(dtype):
+                    schema[name] = "boolean"
+                elif pd.api.types.is_integer_dtype(dtype):
+                    schema[name] = "Int64"
+        return schema
+
+    def __estimate_row_bytes(self, data_start: int) -> int:
+        with open(self.path, "rb") as file:
+            file.seek(data_start)
+            sample = file.read(SAMPLE_BYTES)
+        return max(1, math.ceil(len(sample) / max(1, sample.count(b"\n"))))
@@ -0,0 +1,16 @@
+import os
+from .base_extractor import BaseExtractor
+
+
+class FileExtractor(BaseExtractor):
+    """Base for extractors that read a local file instead of a database"""
+
+    def __init__(self, path: str):
+        super().__init__()
+        self.path = path
+
+    def connect(self) -> bool:
+        if os.path.isfile(self.path) and os.access(self.path, os.R_OK):
+            return True
+        print(f"Connection failed: cannot read {self.path}")
+        return False
@@ -0,0 +1,51 @@
+from itertools import islice
+from typing import Iterator, Optional
+import pandas as pd
+from .file_extractor import FileExtractor
+from .mongo_extractor import flatten_research_documents
+from etl_engine.core.config import settings
+from etl_engine.utils.categoricals import CategoryDictionary, concat_frames, encode_frame, resolve_categories
+from etl_engine.utils.json_stream import iter_json_records
+
+
+class JsonFileExtractor(FileExtractor):
+    """Extract records from a JSON array or NDJSON file without loading the whole file"""
+
+    def __init__(self, path: str, flatten_papers: bool = False, categories: Optional[CategoryDictionary] = None):
+        super().__init__(path)
+        # Low-cardinality columns are emitted dictionary-encoded, like the database extractors do.
+        self.categories = resolve_categories(categories)
+        # Research-paper exports (faculty documents with a nested papers list)
+        # are flattened to one row per paper, like MongoExtractor does.
+        self.flatten_papers = flatten_papers
+
+    def extract(self) -> pd.DataFrame:
+        try:
+            chunks = list(self.extract_iter())
+        except Exception:
+            # extract_iter already reported the failure.
+            return pd.DataFrame()
+        df = concat_frames(chunks, self.categories)
+        if df.empty:
+            print(f"No records found in {self.path}.")
+        return df
+
+    def extract_iter(self, chunk_size: Optional[int] = None) -> Iterator[pd.DataFrame]:
+        """Stream the file as DataFrame chunks of chunk_size rows"""
+        chunk_size = chunk_size or settings.EXTRACT_CHUNK_SIZE
+
+        try:
+            records = iter_json_records(self.path)
+            if self.flatten_papers:
+                for chunk in flatten_research_documents(records, chunk_size):
+                    yield encode_frame(chunk, self.categories)
+                return
+
+            while True:
+                batch = list(islice(records, chunk_size))
+                if not batch:
+                    break
+                yield encode_frame(pd.DataFrame.from_records(batch), self.categories)
+        except Exception as e:
+            print(f"Extraction of {self.path} failed: {e}")
+            raise
@@ -1,56 +1,244 @@
+import importlib.util
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 from pymongo.errors import ServerSelectionTimeoutError
 from .base_extractor import BaseExtractor
-from etl_engine.core.mongo_database import get_mongo_db, client
+from etl_engine.core.config import settings
+from etl_engine.core.extraction_cache import ExtractionCache
+from etl_engine.core.mongo_database import DEFAULT_MONGO_SOURCE, get_mongo_client, get_mongo_db
+from etl_engine.core.state_store import ExtractionStateStore
+from etl_engine.utils.bloom_filter import BloomFilter
+from etl_engine.utils.categoricals import CategoryDictionary, concat_frames, encode_frame, resolve_categories
+from etl_engine.utils.keys import id_keys
+from etl_engine.utils.list_columns import build_list_column, to_list_column
+from etl_engine.utils.names import NAME_COLUMNS, split_full_name
+
+RESEARCH_PAPER_COLUMNS = [
+    'faculty_id', 'first_name', 'middle_name', 'last_name', 'department', 'school',
+    'research_area', 'paper_title', 'published_year', 'journal', 'coauthors'
+]
+
+# Only the fields the flattening reads are fetched from the server.
+RESEARCH_PAPER_PROJECTION = {
+    '_id': 0,
+    'faculty_id': 1,
+    'faculty_name': 1,
+    'department': 1,
+    'school': 1,
+    'research_area': 1,
+    'papers.title': 1,
+    'papers.year': 1,
+    'papers.journal': 1,
+    'papers.co_authors': 1,
+}
+
+
+def flatten_research_documents(documents: Iterable[Dict[str, Any]], chunk_size: Optional[int] = None,
+                               list_arrays: bool = False) -> Iterator[pd.DataFrame]:
+    """Flatten faculty documents into one row per paper, filling per-column buffers
+
+    A DataFrame chunk is emitted as soon as chunk_size rows have accumulated, so
+    no list of per-paper dicts is ever built. With no chunk_size everything is
+    emitted as a single frame at the end. Faculty names are split per chunk,
+    one column at a time. With list_arrays, coauthors go into one flat buffer
+    plus offsets and are emitted as an Arrow list column (requires pyarrow).
+    """
+    columns = {column: [] for column in RESEARCH_PAPER_COLUMNS if column not in NAME_COLUMNS}
+    columns['faculty_name'] = []
+    faculty_ids, faculty_names = columns['faculty_id'], columns['faculty_name']
+    departments, schools, research_areas = columns['department'], columns['school'], columns['research_area']
+    titles, years, journals, coauthors = (
+        columns['paper_title'], columns['published_year'], columns['journal'], columns['coauthors']
+    )
+    coauthor_offsets = [0] if list_arrays else None
+
+    for doc in documents:
+        for paper in doc['papers']:
+            faculty_ids.append(doc['faculty_id'])
+            faculty_names.append(doc['faculty_name'])
+            departments.append(doc['department'])
+            schools.append(doc['school'])
+            research_areas.append(doc['research_area'])
+            titles.append(paper['title'])
+            years.append(paper['year'])
+            journals.append(paper['journal'])
+            if list_arrays:
+                coauthors.extend(paper['co_authors'])
+                coauthor_offsets.append(len(coauthors))
+            else:
+                coauthors.append(paper['co_authors'])
+
+            # Flush mid-document, so a faculty member with many papers cannot overfill a chunk.
+            if chunk_size and len(titles) >= chunk_size:
+                yield _build_research_frame(columns, coauthor_offsets)
+                for buffer in columns.values():
+                    buffer.clear()
+                if list_arrays:
+                    coauthor_offsets[:] = [0]
+
+    if titles:
+        yield _build_research_frame(columns, coauthor_offsets)
+
+
+def _build_research_frame(columns: Dict[str, list], coauthor_offsets: Optional[List[int]] = None) -> pd.DataFrame:
+    data = {column: values for column, values in columns.items() if column != 'faculty_name'}
+    if coauthor_offsets is not None:
+        data['coauthors'] = build_list_column(data['coauthors'], coauthor_offsets)
+    df = pd.DataFrame(data)
+    names_df = split_full_name(pd.Series(columns['faculty_name'], dtype="object"))
+    for position, column in enumerate(NAME_COLUMNS, start=1):
+        df.insert(position, column, names_df[column])
+    return df
+
+
+def collect_flat_rows(rows: Iterable[Dict[str, Any]], chunk_size: Optional[int] = None,
+                      list_arrays: bool = False) -> Iterator[pd.DataFrame]:
+    """Buffer already-flat paper rows (e.g. from the aggregation pipeline) into column chunks"""
+    for df in _collect_flat_rows(rows, chunk_size):
+        if list_arrays:
+            df['coauthors'] = to_list_column(df['coauthors'])
+        yield df
+
+
+def _collect_flat_rows(rows: Iterable[Dict[str, Any]], chunk_size: Optional[int]) -> Iterator[pd.DataFrame]:
+    columns = {column: [] for column in RESEARCH_PAPER_COLUMNS}
+    buffered = 0
+
+    for row in rows:
+        for column, buffer in columns.items():
+            buffer.append(row.get(column))
+        buffered += 1
+
+        if chunk_size and buffered >= chunk_size:
+            yield pd.DataFrame(columns)
+            for buffer in columns.values():
+                buffer.clear()
+            buffered = 0
+
+    if buffered:
+        yield pd.DataFrame(columns)
+
+
+def bloom_candidates(documents: Iterable[Dict[str, Any]], bloom: BloomFilter, key_field: str,
+                     batch_size: int) -> Iterator[Dict[str, Any]]:
+    """Pass on the documents whose key_field may be in the Bloom filter, testing one batch at a time"""
+    batch = []
+    for doc in documents:
+        batch.append(doc)
+        if len(batch) >= batch_size:
+            yield from _bloom_pass(batch, bloom, key_field)
+            batch = []
+    yield from _bloom_pass(batch, bloom, key_field)
+
+
+def _bloom_pass(batch: List[Dict[str, Any]], bloom: BloomFilter, key_field: str) -> Iterator[Dict[str, Any]]:
+    if not batch:
+        return
+    keep = bloom.contains_many(doc.get(key_field) for doc in batch)
+    for doc, kept in zip(batch, keep):
+        if kept:
+            yield doc
+
+
+def build_research_paper_pipeline(match: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+    """Aggregation pipeline that flattens research_papers_v2 into one row per paper"""
+    name_parts = "$name_parts"
+    part_count = {"$size": name_parts}
+
+    pipeline = [{"$match": match}] if match else []
+    pipeline += [
+        {"$unwind": "$papers"},
+        {"$project": {
+            "_id": 0,
+            "faculty_id": 1,
+            "department": 1,
+            "school": 1,
+            "research_area": 1,
+            "name_parts": {"$split": ["$faculty_name", " "]},
+            "paper_title": "$papers.title",
+            "published_year": "$papers.year",
+            "journal": "$papers.journal",
+            "coauthors": "$papers.co_authors",
+        }},
+        # Names are only split when they have exactly two or three parts.
+        {"$project": {
+            "faculty_id": 1,
+            "first_name": {"$cond": [{"$in": [part_count, [2, 3]]}, {"$arrayElemAt": [name_parts, 0]}, None]},
+            "middle_name": {"$cond": [{"$eq": [part_count, 3]}, {"$arrayElemAt": [name_parts, 1]}, None]},
+            "last_name": {"$cond": [{"$in": [part_count, [2, 3]]}, {"$arrayElemAt": [name_parts, -1]}, None]},
+            "department": 1,
+            "school": 1,
+            "research_area": 1,
+            "paper_title": 1,
+            "published_year": 1,
+            "journal": 1,
+            "coauthors": 1,
+        }},
+    ]
+    return pipeline
 
 
 class MongoExtractor(BaseExtractor):
+    def __init__(self, server_side: bool = False, cache: Optional[ExtractionCache] = None,
+                 data_source: str = DEFAULT_MONGO_SOURCE, categories: Optional[CategoryDictionary] = None,
+                 list_arrays: bool = False):
+        super().__init__(data_source)
+        # Low-cardinality columns are emitted dictionary-encoded; pass one
+        # CategoryDictionary to several extractors to share the codes.
+        self.categories = resolve_categories(categories)
+        # Full extracts are served from the cache while the collection's
+        # fingerprint is unchanged.
+        self.cache = cache
+        # Server-side mode lets MongoDB unwind and project the papers, so only
+        # flat paper rows cross the wire.
+        self.server_side = server_side
+        # List-array mode stores coauthors as one flat Arrow buffer plus
+        # offsets instead of a Python list per row.
+        self.list_arrays = list_arrays
+        if self.list_arrays and importlib.util.find_spec("pyarrow") is None:
+            print("pyarrow is not installed, falling back to Python list columns.")
+            self.list_arrays = False
+
     def connect(self) -> bool:
         try:
-            server_info = client.server_info()
+            server_info = get_mongo_client(self.data_source).server_info()
             return True
         except ServerSelectionTimeoutError as e:
             print(f"Connection failed: {e}")
             return False
 
-    def extract(self) -> pd.DataFrame:
+    def extract(self, batch_size: Optional[int] = None, raise_errors: bool = False) -> pd.DataFrame:
+        """Extract every research paper; with raise_errors failures are re-raised after being reported"""
+        if self.cache is not None:
+            try:
+                fingerprint = self.fingerprint()
+            except Exception as e:
+                print(f"Extraction of research papers failed: {e}")
+                if raise_errors:
+                    raise
+                return pd.DataFrame()
+            query = f"research_papers_v2:server_side={self.server_side}:list_arrays={self.list_arrays}"
+            return self.__encode(self.cache.get_or_extract(
+                "mongo", query, fingerprint, lambda: self.__extract(batch_size, raise_errors), arrow_lists=self.list_arrays
+            ))
+        return self.__extract(batch_size, raise_errors)
+
+    def fingerprint(self) -> list:
+        """Cheap change marker for the collection: document count plus the newest _id"""
+        with get_mongo_db(self.data_source) as db:
+            collection = db.research_papers_v2
+            newest = collection.find_one({}, {"_id": 1}, sort=[("_id", -1)])
+            return [collection.estimated_document_count(), str(newest["_id"]) if newest else None]
+
+    def __extract(self, batch_size: Optional[int], raise_errors: bool = False) -> pd.DataFrame:
         try:
-            with get_mongo_db() as db:
-                papers = []
-
-                for doc in db.research_papers_v2.find():
-                    for paper in doc['papers']:
-                        first_name = None
-                        middle_name = None
-                        last_name = None
-                        full_name = doc['faculty_name']
-
-                        if len(full_name) == 2:
-                            first_name = full_name[0]
-                            last_name = full_name[1]
-                        elif len(full_name) == 3:
-                            first_name = full_name[0]
-                            middle_name = full_name[1]
-                            last_name = full_name[2]
-
-                        paper_info = {
-                            'faculty_id': doc['faculty_id'],
-                            'first_name': first_name,
-                            'middle_name': middle_name,
-                            'last_name': last_name,
-                            'department': doc['department'],
-                            'school': doc['school'],
-                            'research_area': doc['research_area'],
-                            'paper_title': paper['title'],
-                            'published_year': paper['year'],
-                            'journal': paper['journal'],
-                            'coauthors': paper['co_authors']
-                        }
-
-                        papers.append(paper_info)
-
-                if papers:
-                    research_paper_df = pd.DataFrame(papers)
+            with get_mongo_db(self.data_source) as db:
+                # Without a chunk size the buffers are flushed once, into a single frame.
+                chunks = list(self.__iter_chunks(db, None, batch_size))
+
+                if chunks:
+                    research_paper_df = chunks[0]
                     return research_paper_df
                 else:
                     print("No research paper data found.")
@@ -58,4 +246,200 @@ class MongoExtractor(BaseExtractor):
 
         except Exception as e:
             print(f"Extraction of research papers failed: {e}")
+            if raise_errors:
+                raise
             return pd.DataFrame()
+
+    def extract_iter(self, chunk_size: Optional[int] = None, batch_size: Optional[int] = None) -> Iterator[pd.DataFrame]:
+        """Stream flattened research papers as DataFrame chunks of about chunk_size rows"""
+        chunk_size = chunk_size or settings.EXTRACT_CHUNK_SIZE
+
+        try:
+            with get_mongo_db(self.data_source) as db:
+                yield from self.__iter_chunks(db, chunk_size, batch_size)
+        except Exception as e:
+            print(f"Chunked extraction of research papers failed: {e}")
+            raise
+
+    def extract_partitioned(self, partitions: Optional[int] = None, split_field: str = '_id',
+                            batch_size: Optional[int] = None) -> pd.DataFrame:
+        """Scan research_papers_v2 as concurrent split_field ranges and merge them in range order"""
+        partitions = partitions or settings.EXTRACT_MAX_WORKERS
+
+        try:
+            with get_mongo_db(self.data_source) as db:
+                ranges = self.__plan_split_ranges(db, partitions, split_field)
+
+                # MongoClient is thread-safe, so every partition shares its pool.
+                with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+                    frames = list(executor.map(
+                        lambda bounds: self.__read_partition(db, split_field, bounds, batch_size), ranges
+                    ))
+
+            return self.__concat(frames)
+
+        except Exception as e:
+            print(f"Partitioned extraction of research papers failed: {e}")
+            return pd.DataFrame()
+
+    def extract_semi_join(self, keys: Iterable[Any], batch_size: Optional[int] = None) -> pd.DataFrame:
+        """Extract only the documents whose faculty_id is in keys, e.g. faculty_ids selected on the SQL side
+
+        Up to MONGO_SEMI_JOIN_MAX_IN_KEYS keys are pushed to the server as
+        batched $in filters, so with an index on faculty_id only matching
+        documents are read. Larger key sets are checked against a Bloom filter
+        during a scan of the projected documents, so the papers of rejected
+        documents are never flattened. The filter's false positives are
+        dropped from the result. Keys are normalized once to trimmed strings,
+        the type faculty_id has in research_papers_v2, so both paths agree
+        for e.g. the integer ids select_keys returns.
+        """
+        keys = id_keys(pd.Series(list(keys), dtype=object)).dropna().unique().tolist()
+        if not keys:
+            return pd.DataFrame()
+
+        try:
+            with get_mongo_db(self.data_source) as db:
+                if len(keys) <= settings.MONGO_SEMI_JOIN_MAX_IN_KEYS:
+                    step = settings.MONGO_SEMI_JOIN_IN_BATCH
+                    frames = [
+                        chunk
+                        for start in range(0, len(keys), step)
+                        for chunk in self.__iter_chunks(db, None, batch_size, match={'faculty_id': {"$in": keys[start:start + step]}})
+                    ]
+                else:
+                    frames = list(self.__iter_bloom_chunks(db, keys, batch_size))
+
+            return self.__concat(frames)
+
+        except Exception as e:
+            print(f"Semi-join extraction of research papers failed: {e}")
+            return pd.DataFrame()
+
+    def extract_incremental(self, job: str, watermark_field: str = '_id',
+                            state_store: Optional[ExtractionStateStore] = None,
+                            batch_size: Optional[int] = None) -> pd.DataFrame:
+        """Fetch documents past the stored watermark and merge their papers into the previous snapshot
+
+        The default _id watermark picks up newly inserted documents (ObjectIds
+        grow with insertion time); pass an update-timestamp field to also pick
+        up documents changed in place.
+        """
+        source = "research_papers_v2"
+        state_store = state_store or ExtractionStateStore()
+
+        try:
+            with get_mongo_db(self.data_source) as db:
+                watermark = state_store.get_watermark(job, source)
+                match = {watermark_field: {"$gt": watermark}} if watermark is not None else {}
+
+                # Pin the upper bound first so documents written during the read
+                # are left for the next run instead of being half-seen.
+                newest = db.research_papers_v2.find_one(match, {watermark_field: 1}, sort=[(watermark_field, -1)])
+                if newest is None:
+                    snapshot_df = state_store.load_snapshot(job, source)
+                    return snapshot_df if snapshot_df is not None else pd.DataFrame()
+
+                high_watermark = newest[watermark_field]
+                match = {watermark_field: dict(match.get(watermark_field, {}), **{"$lte": high_watermark})}
+                chunks = list(self.__iter_chunks(db, None, batch_size, match=match))
+                delta_df = chunks[0] if chunks else pd.DataFrame(columns=RESEARCH_PAPER_COLUMNS)
+
+            snapshot_df = state_store.load_snapshot(job, source)
+            if snapshot_df is not None and not snapshot_df.empty:
+                # A re-read document replaces every paper row it produced before.
+                snapshot_df = snapshot_df[~snapshot_df['faculty_id'].isin(delta_df['faculty_id'])]
+                merged_df = self.__encode(pd.concat([snapshot_df, delta_df], ignore_index=True))
+            else:
+                merged_df = delta_df
+
+            state_store.save_snapshot(job, source, merged_df)
+            state_store.set_watermark(job, source, high_watermark)
+            return merged_df
+
+        except Exception as e:
+            print(f"Incremental extraction of research papers failed: {e}")
+            return pd.DataFrame()
+
+    @staticmethod
+    def __plan_split_ranges(db, partitions: int, split_field: str) -> List[Tuple[Any, Any]]:
+        """Derive split points from a $sample of split_field values"""
+        if partitions <= 1:
+            return [(None, None)]
+
+        sample_size = partitions * settings.MONGO_SPLIT_SAMPLES_PER_PARTITION
+        sample = db.research_papers_v2.aggregate([
+            {"$sample": {"size": sample_size}},
+            {"$project": {"_id": 0, "key": f"${split_field}"}},
+        ])
+        keys = sorted({row["key"] for row in sample if row.get("key") is not None})
+
+        # Evenly spaced quantiles of the sample approximate equal-sized partitions.
+        step = len(keys) / partitions
+        split_points = sorted({keys[int(i * step)] for i in range(1, partitions) if int(i * step) < len(keys)})
+
+        bounds = [None] + split_points + [None]
+        return list(zip(bounds[:-1], bounds[1:]))
+
+    def __read_partition(self, db, split_field: str, bounds: Tuple[Any, Any], batch_size: Optional[int]) -> pd.DataFrame:
+        lower, upper = bounds
+        key_filter = {}
+        if lower is not None:
+            key_filter["$gte"] = lower
+        if upper is not None:
+            key_filter["$lt"] = upper
+        match = {split_field: key_filter} if key_filter else {}
+
+        chunks = list(self.__iter_chunks(db, None, batch_size, match=match, sort_field=split_field))
+        return chunks[0] if chunks else pd.DataFrame()
+
+    def __encode(self, df: pd.DataFrame) -> pd.DataFrame:
+        if self.list_arrays and 'coauthors' in df.columns:
+            # Frames read back from the cache or a snapshot hold per-row arrays.
+            df = df.assign(coauthors=to_list_column(df['coauthors']))
+        return encode_frame(df, self.categories)
+
+    def __concat(self, frames: List[pd.DataFrame]) -> pd.DataFrame:
+        df = concat_frames(frames, self.categories)
+        if df.empty:
+            print("No research paper data found.")
+        return df
+
+    def __iter_bloom_chunks(self, db, keys: List[str], batch_size: Optional[int]) -> Iterator[pd.DataFrame]:
+        batch_size = batch_size or settings.MONGO_BATCH_SIZE
+        bloom = BloomFilter.from_keys(keys, settings.MONGO_SEMI_JOIN_BLOOM_ERROR_RATE)
+        documents = db.research_papers_v2.find({}, RESEARCH_PAPER_PROJECTION, batch_size=batch_size)
+
+        key_set = set(keys)
+        candidates = bloom_candidates(documents, bloom, 'faculty_id', batch_size)
+        for chunk in flatten_research_documents(candidates, settings.EXTRACT_CHUNK_SIZE, self.list_arrays):
+            if 'faculty_id' in chunk.columns:
+                chunk = chunk[chunk['faculty_id'].astype(str).isin(key_set)].reset_index(drop=True)
+            yield self.__encode(chunk)
+
+    def __iter_chunks(self, db, chunk_size: Optional[int], batch_size: Optional[int],
+                      match: Optional[Dict[str, Any]] = None, sort_field: Optional[str] = None) -> Iterator[pd.DataFrame]:
+        for chunk in self.__iter_raw_chunks(db, chunk_size, batch_size, match, sort_field):
+            yield self.__encode(chunk)
+
+    def __iter_raw_chunks(self, db, chunk_size: Optional[int], batch_size: Optional[int],
+                          match: Optional[Dict[str, Any]], sort_field: Optional[str]) -> Iterator[pd.DataFrame]:
+        batch_size = batch_size or settings.MONGO_BATCH_SIZE
+        collection = db.research_papers_v2
+        match = match or {}
+
+        if self.server_side:
+            pipeline = build_research_paper_pipeline(match)
+            if sort_field:
+                pipeline.insert(1 if match else 0, {"$sort": {sort_field: 1}})
+            rows = collection.aggregate(
+                pipeline,
+                allowDiskUse=True,
+                batchSize=batch_size
+            )
+            return collect_flat_rows(rows, chunk_size, self.list_arrays)
+
+        documents = collection.find(match, RESEARCH_PAPER_PROJECTION, batch_size=batch_size)
+        if sort_field:
+            documents = documents.sort(sort_field, 1)
+        return flatten_research_documents(documents, chunk_size, self.list_arrays)
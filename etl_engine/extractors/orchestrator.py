@@ -0,0 +1,54 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+from etl_engine.core.config import settings
+
+
+class ExtractionOrchestrator:
+    """Run independent source reads concurrently and time each of them"""
+
+    def __init__(self, max_concurrency: Optional[int] = None):
+        self.max_concurrency = max_concurrency or settings.EXTRACT_MAX_CONCURRENT_SOURCES
+        self.sources: Dict[str, Callable[[], Any]] = {}
+        self.timings: Dict[str, float] = {}
+        self.errors: Dict[str, Exception] = {}
+
+    def add_source(self, name: str, extract: Callable[[], Any]) -> "ExtractionOrchestrator":
+        """Register a zero-argument callable that reads one source"""
+        if name in self.sources:
+            raise ValueError(f"Source '{name}' is already registered")
+        self.sources[name] = extract
+        return self
+
+    def run(self) -> Dict[str, Any]:
+        """Run every registered source and return the results keyed by source name"""
+        self.timings = {}
+        self.errors = {}
+
+        if not self.sources:
+            return {}
+
+        workers = min(self.max_concurrency, len(self.sources))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="extract") as executor:
+            futures = {name: executor.submit(self._timed, name, extract) for name, extract in self.sources.items()}
+            results = {}
+            for name, future in futures.items():
+                try:
+                    results[name] = future.result()
+                except Exception as e:
+                    print(f"Extraction of source '{name}' failed: {e}")
+                    self.errors[name] = e
+
+        return results
+
+    def _timed(self, name: str, extract: Callable[[], Any]) -> Any:
+        start = time.perf_counter()
+        try:
+            return extract()
+        finally:
+            self.timings[name] = time.perf_counter() - start
+
+    def report(self) -> str:
+        """Per-source wall-clock timings, slowest first"""
+        lines = [f"{name}: {seconds:.3f}s" for name, seconds in sorted(self.timings.items(), key=lambda x: x[1], reverse=True)]
+        return "\n".join(lines)
@@ -1,17 +1,82 @@
-from sqlalchemy import text
+from sqlalchemy import Integer, String, func, select, text
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Optional, Sequence, Tuple
+import importlib.util
+import math
 import pandas as pd
 from .base_extractor import BaseExtractor
 from etl_engine.models.faculty_model import Faculty
 from etl_engine.models.department_model import Department
 from etl_engine.models.school_model import School
-from etl_engine.core.sql_database import get_sql_db
+from etl_engine.core.config import settings
+from etl_engine.core.extraction_cache import ExtractionCache
+from etl_engine.core.sql_database import DEFAULT_SQL_SOURCE, get_sql_db
+from etl_engine.core.state_store import ExtractionStateStore
+from etl_engine.utils.categoricals import CategoryDictionary, concat_frames, encode_frame, resolve_categories
+
+
+TABLE_MODELS = {
+    Faculty.__tablename__: Faculty,
+    Department.__tablename__: Department,
+    School.__tablename__: School,
+}
+
+
+def get_table_model(table: str):
+    """Model for an extractable table name"""
+    if table not in TABLE_MODELS:
+        raise ValueError(f"Unknown table '{table}', expected one of {list(TABLE_MODELS)}")
+    return TABLE_MODELS[table]
+
+
+def core_select(model):
+    """Select the model's exported columns, labelled with their as_dict() names"""
+    return select(*[column.label(name) for name, column in model.export_columns().items()])
+
+
+def column_dtype(column, use_arrow: bool = False) -> Optional[str]:
+    """Map a SQLAlchemy column type to a nullable pandas dtype"""
+    if isinstance(column.type, Integer):
+        return "int64[pyarrow]" if use_arrow else "Int64"
+    if isinstance(column.type, String):
+        return "string[pyarrow]" if use_arrow else "string"
+    return None
+
+
+def build_columnar_frame(model, rows: Sequence, use_arrow: bool = False) -> pd.DataFrame:
+    """Transpose Core rows into one typed array per column"""
+    columns = model.export_columns()
+    values = list(zip(*rows)) if rows else [()] * len(columns)
+
+    data = {}
+    for (name, column), column_values in zip(columns.items(), values):
+        data[name] = pd.array(column_values, dtype=column_dtype(column, use_arrow))
+
+    return pd.DataFrame(data)
 
 
 class SQLExtractor(BaseExtractor):
+    def __init__(self, columnar: bool = False, use_arrow: bool = False, cache: Optional[ExtractionCache] = None,
+                 data_source: str = DEFAULT_SQL_SOURCE, categories: Optional[CategoryDictionary] = None):
+        super().__init__(data_source)
+        # Low-cardinality columns are emitted dictionary-encoded; pass one
+        # CategoryDictionary to several extractors to share the codes.
+        self.categories = resolve_categories(categories)
+        # Whole-table reads are served from the cache while the table's
+        # fingerprint is unchanged.
+        self.cache = cache
+        # Columnar mode reads Core rows straight into typed column arrays
+        # instead of hydrating an ORM instance per row.
+        self.columnar = columnar
+        self.use_arrow = use_arrow and columnar
+        if self.use_arrow and importlib.util.find_spec("pyarrow") is None:
+            print("pyarrow is not installed, falling back to numpy-backed dtypes.")
+            self.use_arrow = False
+
     def connect(self) -> bool:
         try:
             # Test the connection.
-            with get_sql_db() as db:
+            with get_sql_db(self.data_source) as db:
                 query = text("SELECT 1;")
                 result = db.execute(query)
                 _ = result.fetchone()
@@ -21,41 +86,242 @@ class SQLExtractor(BaseExtractor):
             return False
 
     def extract(self) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
-        faculty_df = self.__extract_faculty_information()
-        department_df = self.__extract_department_information()
-        school_df = self.__extract_school_information()
+        faculty_df = encode_frame(self.__extract_faculty_information(), self.categories)
+        department_df = encode_frame(self.__extract_department_information(), self.categories)
+        school_df = encode_frame(self.__extract_school_information(), self.categories)
 
         return faculty_df, department_df, school_df
 
+    def extract_table(self, table: str, raise_errors: bool = False) -> pd.DataFrame:
+        """Extract a single table, so independent tables can be scheduled separately
+
+        With raise_errors a failure is re-raised after it is reported instead
+        of returning an empty frame, e.g. so an orchestrator can record it.
+        """
+        model = get_table_model(table)
+        try:
+            return encode_frame(self.__extract_table(model), self.categories)
+        except Exception as e:
+            print(f"Extraction of {table} failed: {e}")
+            if raise_errors:
+                raise
+            return pd.DataFrame()
+
+    def extract_iter(self, chunk_size: Optional[int] = None, table: str = Faculty.__tablename__) -> Iterator[pd.DataFrame]:
+        """Stream a table as DataFrame chunks using a server-side cursor"""
+        model = get_table_model(table)
+        chunk_size = chunk_size or settings.EXTRACT_CHUNK_SIZE
+
+        try:
+            with get_sql_db(self.data_source) as db:
+                # yield_per streams results from the server and only keeps one
+                # partition of rows alive at a time.
+                if self.columnar:
+                    query = core_select(model).execution_options(yield_per=chunk_size)
+                    for rows in db.execute(query).partitions():
+                        yield encode_frame(build_columnar_frame(model, rows, self.use_arrow), self.categories)
+                else:
+                    result = db.execute(select(model).execution_options(yield_per=chunk_size))
+                    for rows in result.scalars().partitions():
+                        yield encode_frame(pd.DataFrame([row.as_dict() for row in rows]), self.categories)
+        except Exception as e:
+            print(f"Chunked extraction of {table} failed: {e}")
+            raise
+
+    def select_keys(self, table: str = Faculty.__tablename__, key_column: str = 'faculty_id', **filters) -> list:
+        """Distinct key_column values of the rows matching column=value filters, e.g. to scope a Mongo semi-join"""
+        model = get_table_model(table)
+        columns = model.export_columns()
+        unknown = [name for name in [key_column, *filters] if name not in columns]
+        if unknown:
+            raise ValueError(f"Unknown columns {unknown} for table '{table}'")
+
+        query = select(columns[key_column]).distinct()
+        for name, value in filters.items():
+            query = query.where(columns[name] == value)
+        try:
+            with get_sql_db(self.data_source) as db:
+                return list(db.execute(query).scalars())
+        except Exception as e:
+            print(f"Key selection from {table} failed: {e}")
+            return []
+
+    def extract_columnar(self, table: str = Faculty.__tablename__) -> pd.DataFrame:
+        """Read a whole table with a Core select into typed columns, bypassing the ORM"""
+        return encode_frame(self.__read_columnar(get_table_model(table)), self.categories)
+
+    def extract_partitioned(self, table: str = Faculty.__tablename__, max_workers: Optional[int] = None,
+                            partition_rows: Optional[int] = None) -> pd.DataFrame:
+        """Read a table as concurrent primary-key range scans and concatenate them in key order"""
+        model = get_table_model(table)
+        max_workers = max_workers or settings.EXTRACT_MAX_WORKERS
+        partition_rows = partition_rows or settings.EXTRACT_PARTITION_ROWS
+
+        primary_key = list(model.__table__.primary_key.columns)
+        if len(primary_key) != 1 or not isinstance(primary_key[0].type, Integer):
+            # Range splitting needs a single integer key; read the table in one pass.
+            return encode_frame(self.__read_columnar(model), self.categories)
+        primary_key = primary_key[0]
+
+        try:
+            ranges = self.__plan_key_ranges(primary_key, max_workers, partition_rows)
+            if len(ranges) <= 1:
+                return encode_frame(self.__read_columnar(model), self.categories)
+
+            # Every range opens its own session, and so its own pooled connection.
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                frames = list(executor.map(
+                    lambda key_range: self.__read_key_range(model, primary_key, key_range), ranges
+                ))
+            return concat_frames(frames, self.categories)
+        except Exception as e:
+            print(f"Partitioned extraction of {table} failed: {e}")
+            return pd.DataFrame()
+
+    def __plan_key_ranges(self, primary_key, max_workers: int, partition_rows: int) -> List[Tuple[int, int]]:
+        """Split the key space into inclusive ranges sized from min/max and a row count estimate"""
+        with get_sql_db(self.data_source) as db:
+            low, high = db.execute(select(func.min(primary_key), func.max(primary_key))).one()
+            if low is None:
+                return []
+            # Table statistics avoid a full COUNT(*) scan; the key span bounds
+            # the row count when the dialect keeps no estimate.
+            key_span = high - low + 1
+            count = self.__estimate_rows(db, primary_key.table.name) or key_span
+
+        if count <= partition_rows:
+            return [(low, high)]
+
+        # Use at least one range per worker, more when the table is large, so a
+        # sparse or skewed key range does not leave a single slow straggler.
+        partitions = min(max(max_workers, math.ceil(count / partition_rows)), key_span)
+        step = math.ceil(key_span / partitions)
+
+        return [(start, min(start + step - 1, high)) for start in range(low, high + 1, step)]
+
+    @staticmethod
+    def __estimate_rows(db, table_name: str) -> Optional[int]:
+        """Row count from the database's table statistics, or None where there are none"""
+        dialect = db.get_bind().dialect.name
+        if dialect == "mysql":
+            query = text("SELECT TABLE_ROWS FROM information_schema.TABLES "
+                         "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table")
+        elif dialect == "postgresql":
+            query = text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table)")
+        else:
+            return None
+        estimate = db.execute(query, {"table": table_name}).scalar()
+        # PostgreSQL reports -1 for a table that was never analyzed.
+        return estimate if estimate and estimate > 0 else None
+
+    def __read_key_range(self, model, primary_key, key_range: Tuple[int, int]) -> pd.DataFrame:
+        query = (
+            core_select(model)
+            .where(primary_key.between(*key_range))
+            .order_by(primary_key)
+        )
+        with get_sql_db(self.data_source) as db:
+            rows = db.execute(query).all()
+        return encode_frame(build_columnar_frame(model, rows, self.use_arrow), self.categories)
+
+    def extract_incremental(self, job: str, table: str = Faculty.__tablename__,
+                            watermark_column: Optional[str] = None,
+                            state_store: Optional[ExtractionStateStore] = None) -> pd.DataFrame:
+        """Fetch rows past the stored watermark and merge them into the previous snapshot
+
+        watermark_column names an exported column that only grows for new or
+        changed rows (the primary key by default, or an update timestamp).
+        """
+        model = get_table_model(table)
+        state_store = state_store or ExtractionStateStore()
+        columns = model.export_columns()
+        key_names = [self.__export_name(model, column) for column in model.__table__.primary_key.columns]
+        watermark_column = watermark_column or key_names[0]
+        if watermark_column not in columns:
+            raise ValueError(f"Unknown watermark column '{watermark_column}' for table '{table}'")
+
+        try:
+            watermark = state_store.get_watermark(job, table)
+            query = core_select(model).order_by(columns[watermark_column])
+            if watermark is not None:
+                query = query.where(columns[watermark_column] > watermark)
+
+            with get_sql_db(self.data_source) as db:
+                rows = db.execute(query).all()
+            delta_df = build_columnar_frame(model, rows, self.use_arrow)
+
+            snapshot_df = state_store.load_snapshot(job, table)
+            if snapshot_df is not None and not snapshot_df.empty:
+                # Changed rows replace their previous version.
+                merged_df = pd.concat([snapshot_df, delta_df], ignore_index=True)
+                merged_df = merged_df.drop_duplicates(subset=key_names, keep="last").reset_index(drop=True)
+            else:
+                merged_df = delta_df
+
+            if not delta_df.empty:
+                state_store.save_snapshot(job, table, merged_df)
+                state_store.set_watermark(job, table, delta_df[watermark_column].max())
+
+            return encode_frame(merged_df, self.categories)
+        except Exception as e:
+            print(f"Incremental extraction of {table} failed: {e}")
+            return pd.DataFrame()
+
+    @staticmethod
+    def __export_name(model, column) -> str:
+        """Name under which a table column appears in as_dict()/export_columns()"""
+        for name, attribute in model.export_columns().items():
+            if attribute.property.columns[0] is column:
+                return name
+        raise ValueError(f"Column '{column.name}' is not exported by {model.__name__}")
+
+    def __read_columnar(self, model) -> pd.DataFrame:
+        with get_sql_db(self.data_source) as db:
+            rows = db.execute(core_select(model)).all()
+        return build_columnar_frame(model, rows, self.use_arrow)
+
+    def fingerprint(self, table: str) -> list:
+        """Cheap change marker for a table: row count plus the largest primary key"""
+        model = get_table_model(table)
+        primary_key = list(model.__table__.primary_key.columns)[0]
+        with get_sql_db(self.data_source) as db:
+            count, max_key = db.execute(select(func.count(), func.max(primary_key))).one()
+        return [count, max_key]
+
+    def __extract_table(self, model) -> pd.DataFrame:
+        if self.cache is not None:
+            table = model.__tablename__
+            mode = "arrow" if self.use_arrow else "columnar" if self.columnar else "orm"
+            return self.cache.get_or_extract(
+                "sql", f"{table}:{mode}", self.fingerprint(table), lambda: self.__read_table(model)
+            )
+        return self.__read_table(model)
+
+    def __read_table(self, model) -> pd.DataFrame:
+        if self.columnar:
+            return self.__read_columnar(model)
+
+        with get_sql_db(self.data_source) as db:
+            records = db.query(model).all()
+            return pd.DataFrame([record.as_dict() for record in records])
+
     def __extract_faculty_information(self) -> pd.DataFrame:
         try:
-            with get_sql_db() as db:
-                faculties = db.query(Faculty).all()
-                faculty_data = [faculty.as_dict() for faculty in faculties]
-                faculty_df = pd.DataFrame(faculty_data)
-                return faculty_df
+            return self.__extract_table(Faculty)
         except Exception as e:
             print(f"Extraction of faculty information failed: {e}")
             return pd.DataFrame()
 
     def __extract_department_information(self) -> pd.DataFrame:
         try:
-            with get_sql_db() as db:
-                departments = db.query(Department).all()
-                department_data = [department.as_dict() for department in departments]
-                department_df = pd.DataFrame(department_data)
-                return department_df
+            return self.__extract_table(Department)
         except Exception as e:
             print(f"Extraction of department information failed: {e}")
             return pd.DataFrame()
 
     def __extract_school_information(self) -> pd.DataFrame:
         try:
-            with get_sql_db() as db:
-                schools = db.query(School).all()
-                school_data = [school.as_dict() for school in schools]
-                school_df = pd.DataFrame(school_data)
-                return school_df
+            return self.__extract_table(School)
         except Exception as e:
             print(f"Extraction of school information failed: {e}")
             return pd.DataFrame()
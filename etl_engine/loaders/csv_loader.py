@@ -1,5 +1,7 @@
 import csv
-from etl_engine.extractors.sql_extractor import sql
+from typing import Iterable
+import pandas as pd
+from etl_engine.extractors.sql_extractor import SQLExtractor
 
 
 def csv_loader(department_df, school_df):
@@ -7,7 +9,18 @@ def csv_loader(department_df, school_df):
     school_df.to_csv("school_details.csv")
 
 
+def csv_chunk_loader(chunks: Iterable[pd.DataFrame], path: str) -> int:
+    """Append DataFrame chunks to a single CSV file, writing the header once"""
+    rows_written = 0
+    for chunk in chunks:
+        chunk.to_csv(path, mode="w" if rows_written == 0 else "a", header=rows_written == 0, index=False)
+        rows_written += len(chunk)
+    return rows_written
+
+
 if __name__ == "__main__":
+    sql = SQLExtractor()
     if sql.connect():
         faculty_df, department_df, school_df = sql.extract()
-    csv_loader(department_df, school_df)
+        csv_loader(department_df, school_df)
+        csv_chunk_loader(sql.extract_iter(table="faculties"), "faculty_details.csv")
@@ -1,26 +1,49 @@
 import pandas as pd
 from etl_engine.extractors.sql_extractor import SQLExtractor
 from etl_engine.extractors.mongo_extractor import MongoExtractor
+from etl_engine.extractors.orchestrator import ExtractionOrchestrator
+from etl_engine.core.config import settings
+from etl_engine.core.extraction_cache import ExtractionCache
+from etl_engine.transformers import FacultyResearchJoiner
+from etl_engine.utils.categoricals import CategoryDictionary
 from collections import Counter
 import json
 from typing import Dict, Any
 
 def main():
-    sql_extractor = SQLExtractor()
-    mongo_extractor = MongoExtractor()
+    cache = ExtractionCache() if settings.EXTRACT_CACHE_ENABLED else None
+    # One dictionary, so e.g. SQL department_name and Mongo department share codes.
+    categories = CategoryDictionary() if settings.EXTRACT_CATEGORICAL else None
+    sql_extractor = SQLExtractor(cache=cache, categories=categories)
+    mongo_extractor = MongoExtractor(cache=cache, categories=categories)
 
-    # Extract
-    try:
-        faculty_df, deparment_df, school_df = sql_extractor.extract()
-    except Exception as e:
-        print(f"SQL extraction failed: {e}")
+    # Extract: every table and collection is independent, so read them concurrently.
+    # Failures are raised so the orchestrator records them.
+    orchestrator = ExtractionOrchestrator()
+    orchestrator.add_source("faculties", lambda: sql_extractor.extract_table("faculties", raise_errors=True))
+    orchestrator.add_source("departments", lambda: sql_extractor.extract_table("departments", raise_errors=True))
+    orchestrator.add_source("schools", lambda: sql_extractor.extract_table("schools", raise_errors=True))
+    orchestrator.add_source("research_papers", lambda: mongo_extractor.extract(raise_errors=True))
+
+    results = orchestrator.run()
+    print(orchestrator.report())
+    if cache is not None:
+        print(cache.report())
+    if orchestrator.errors:
+        print(f"Extraction failed for: {', '.join(orchestrator.errors)}")
         return
 
-    try:
-        research_df = mongo_extractor.extract()
-    except Exception as e:
-        print(f"Mongo extraction failed: {e}")
+    faculty_df = results["faculties"]
+    deparment_df = results["departments"]
+    school_df = results["schools"]
+    research_df = results["research_papers"]
+
+    # Link papers to faculty records
+    if faculty_df.empty or research_df.empty:
+        print("No faculty or research paper rows to join")
         return
+    joiner = FacultyResearchJoiner(faculty_df).add_papers(research_df)
+    print(joiner.report())
 
 
 if __name__ == "__main__":
@@ -22,3 +22,12 @@ class Department(Base):
             "school": self.school_name,
             "number_of_faculty": self.number_of_faculty
         }
+
+    @classmethod
+    def export_columns(cls):
+        """Column attributes keyed by their as_dict() name, for Core-level selects"""
+        return {
+            "department_name": cls.department_name,
+            "school": cls.school_name,
+            "number_of_faculty": cls.number_of_faculty
+        }
@@ -32,3 +32,16 @@ class Faculty(Base):
             "school_name": self.school_name,
             "position": self.position
         }
+
+    @classmethod
+    def export_columns(cls):
+        """Column attributes keyed by their as_dict() name, for Core-level selects"""
+        return {
+            "faculty_id": cls.faculty_id,
+            "first_name": cls.first_name,
+            "middle_name": cls.middle_name,
+            "last_name": cls.last_name,
+            "department_name": cls.department_name,
+            "school_name": cls.school_name,
+            "position": cls.position
+        }
@@ -19,3 +19,10 @@ class School(Base):
         return {
             "school_name": self.school_name
         }
+
+    @classmethod
+    def export_columns(cls):
+        """Column attributes keyed by their as_dict() name, for Core-level selects"""
+        return {
+            "school_name": cls.school_name
+        }
@@ -20,3 +20,23 @@ class FacultyResearchMapping(BaseModel):
     department: str
     school: str
     position: str
+
+class CoauthorNetworkAnalysis(BaseModel):
+    total_authors: int
+    total_collaborations: int
+    connected_components: int
+    largest_component_size: int
+    top_authors_by_degree: Dict[str, int]
+    top_authors_by_pagerank: Dict[str, float]
+    top_authors_by_betweenness: Dict[str, float]
+
+class ResearchSketchAnalysis(BaseModel):
+    total_publications: int
+    distinct_coauthors: int
+    distinct_journals: int
+    distinct_research_areas: int
+    top_research_areas: Dict[str, int]
+    # Standard error of the distinct counts, as a fraction of the count.
+    distinct_relative_error: float
+    # Top research-area counts overcount by at most this much (99.3% confidence).
+    top_count_error_bound: float
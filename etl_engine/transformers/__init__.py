@@ -1,2 +1,5 @@
 from .faculty_transformer import FacultyTransformer
 from .research_transformer import ResearchTransformer
+from .faculty_research_join import FacultyResearchJoiner
+from .coauthor_graph import CoauthorGraph
+from .sketches import HeavyHitters, HyperLogLog, ResearchSketchAggregate
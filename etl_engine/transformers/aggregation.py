@@ -0,0 +1,47 @@
+from typing import Any, Dict, List, Tuple
+import numpy as np
+import pandas as pd
+from etl_engine.utils.list_columns import explode_list_column, is_list_column
+
+
+def encode_column(values: pd.Series) -> Tuple[np.ndarray, pd.Index]:
+    """Categorical codes and their dictionary; missing values get code -1"""
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        return values.cat.codes.to_numpy(dtype=np.int64), values.cat.categories
+    codes, uniques = pd.factorize(values, use_na_sentinel=True)
+    return codes.astype(np.int64, copy=False), pd.Index(uniques)
+
+
+def count_dimensions(df: pd.DataFrame, columns: List[str], lowercase: bool = False) -> Dict[str, Dict[Any, int]]:
+    """Count rows per value for every requested column
+
+    Each column is dictionary-encoded and counted with one bincount over its
+    codes, so memory stays proportional to the number of distinct values.
+    Missing values are not counted.
+    """
+    counts = {}
+    for column in columns:
+        codes, uniques = encode_column(df[column])
+        counts[column] = _counts_to_dict(uniques, np.bincount(codes[codes >= 0], minlength=len(uniques)), lowercase)
+    return counts
+
+
+def count_exploded(values: pd.Series, lowercase: bool = False) -> Dict[Any, int]:
+    """Count the elements of a list-valued column (or plain values) with one bincount"""
+    if is_list_column(values):
+        values = explode_list_column(values)
+    codes, uniques = encode_column(values)
+    counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+    return _counts_to_dict(uniques, counts, lowercase)
+
+
+def _counts_to_dict(uniques: pd.Index, counts: np.ndarray, lowercase: bool) -> Dict[Any, int]:
+    """Pair dictionary values with counts, merging values that only differ in case"""
+    result: Dict[Any, int] = {}
+    for value, count in zip(uniques.tolist(), counts.tolist()):
+        if count == 0:
+            continue
+        if lowercase and isinstance(value, str):
+            value = value.lower()
+        result[value] = result.get(value, 0) + count
+    return result
@@ -0,0 +1,195 @@
+from typing import Optional, Tuple
+import numpy as np
+import pandas as pd
+from etl_engine.utils.list_columns import explode_list_column
+from etl_engine.utils.names import NAME_COLUMNS, normalize_full_name, normalize_names
+
+
+def paper_authors(research_df: pd.DataFrame) -> pd.Series:
+    """Normalized author names per paper: the faculty member plus every coauthor
+
+    The result is indexed by the paper's row position, one entry per author.
+    Missing and empty names are dropped.
+    """
+    research_df = research_df.reset_index(drop=True)
+    authors = []
+    if all(column in research_df.columns for column in NAME_COLUMNS):
+        authors.append(normalize_names(*(research_df[column] for column in NAME_COLUMNS)))
+    if 'coauthors' in research_df.columns:
+        authors.append(normalize_full_name(explode_list_column(research_df['coauthors'])))
+    if not authors:
+        return pd.Series(dtype=object, name='author')
+
+    author_names = pd.concat(authors).rename('author')
+    return author_names[author_names.notna() & (author_names != '')]
+
+
+class CoauthorGraph:
+    """Undirected coauthor graph in CSR form over interned author ids
+
+    Row i of the adjacency lists author i's collaborators:
+    indices[indptr[i]:indptr[i + 1]]. weights holds the number of papers
+    each pair shares. Every metric works on these flat arrays, so memory
+    grows with the number of edges. There are no per-author Python objects.
+    """
+
+    def __init__(self, authors: pd.Index, indptr: np.ndarray, indices: np.ndarray, weights: np.ndarray):
+        self.authors = authors
+        self.indptr = indptr
+        self.indices = indices
+        self.weights = weights
+
+    @classmethod
+    def from_papers(cls, research_df: pd.DataFrame) -> "CoauthorGraph":
+        """Connect every pair of authors that appear on the same paper"""
+        authors = paper_authors(research_df)
+        author_ids, names = pd.factorize(authors.to_numpy())
+        papers = pd.DataFrame({'paper': authors.index.to_numpy(), 'author': author_ids}).drop_duplicates()
+
+        # Self-join on the paper gives every ordered author pair per paper.
+        pairs = papers.merge(papers, on='paper', suffixes=('_src', '_dst'))
+        pairs = pairs[pairs['author_src'] != pairs['author_dst']]
+        return cls.from_edges(pd.Index(names), pairs['author_src'].to_numpy(), pairs['author_dst'].to_numpy())
+
+    @classmethod
+    def from_edges(cls, authors: pd.Index, sources: np.ndarray, targets: np.ndarray) -> "CoauthorGraph":
+        """Build the CSR arrays from directed (source, target) pairs; repeated pairs add weight"""
+        num_authors = len(authors)
+        edge_keys, weights = np.unique(
+            sources.astype(np.int64) * num_authors + targets.astype(np.int64), return_counts=True
+        )
+        sources, indices = np.divmod(edge_keys, num_authors)
+        indptr = np.zeros(num_authors + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=num_authors), out=indptr[1:])
+        return cls(authors, indptr, indices, weights.astype(np.float64))
+
+    @property
+    def num_authors(self) -> int:
+        return len(self.authors)
+
+    @property
+    def num_edges(self) -> int:
+        """Undirected collaborations; each is stored once per direction"""
+        return len(self.indices) // 2
+
+    def degree(self) -> np.ndarray:
+        """Number of distinct collaborators per author"""
+        return np.diff(self.indptr)
+
+    def weighted_degree(self) -> np.ndarray:
+        """Number of shared papers summed over collaborators"""
+        return np.bincount(self.__edge_sources(), weights=self.weights, minlength=self.num_authors)
+
+    def connected_components(self) -> Tuple[int, np.ndarray]:
+        """Component count and a label per author, by min-label propagation with pointer jumping"""
+        labels = np.arange(self.num_authors)
+        sources = self.__edge_sources()
+        while True:
+            # Hook: every author takes the smallest label among itself and its neighbours.
+            candidate = labels.copy()
+            np.minimum.at(candidate, sources, labels[self.indices])
+            # Hook the old roots too, so whole trees move at once, then shortcut.
+            np.minimum.at(candidate, labels, candidate)
+            candidate = candidate[candidate]
+            while True:
+                jumped = candidate[candidate]
+                if np.array_equal(jumped, candidate):
+                    break
+                candidate = jumped
+            if np.array_equal(candidate, labels):
+                break
+            labels = candidate
+
+        roots, labels = np.unique(labels, return_inverse=True)
+        return len(roots), labels
+
+    def pagerank(self, damping: float = 0.85, tol: float = 1e-6, max_iter: int = 100) -> np.ndarray:
+        """Weighted PageRank by power iteration over the edge arrays
+
+        Isolated authors spread their rank evenly over everyone.
+        """
+        n = self.num_authors
+        if n == 0:
+            return np.zeros(0)
+        sources = self.__edge_sources()
+        strength = self.weighted_degree()
+        transition = self.weights / strength[sources]
+        dangling = strength == 0
+
+        rank = np.full(n, 1.0 / n)
+        for _ in range(max_iter):
+            spread = np.bincount(self.indices, weights=rank[sources] * transition, minlength=n)
+            updated = (1 - damping) / n + damping * (spread + rank[dangling].sum() / n)
+            converged = np.abs(updated - rank).sum() < tol
+            rank = updated
+            if converged:
+                break
+        return rank
+
+    def approximate_betweenness(self, samples: int = 64, seed: Optional[int] = 0) -> np.ndarray:
+        """Betweenness centrality estimated from Brandes' algorithm run from a random sample of sources
+
+        Each breadth-first search expands a whole frontier at once over the
+        CSR arrays. The scores are scaled up to the full source count and
+        count each unordered pair once. With samples >= the number of authors
+        the result is exact.
+        """
+        n = self.num_authors
+        centrality = np.zeros(n)
+        if n == 0:
+            return centrality
+
+        rng = np.random.default_rng(seed)
+        sources = np.arange(n) if samples >= n else rng.choice(n, size=samples, replace=False)
+        for source in sources:
+            centrality += self.__source_dependencies(source)
+        return centrality * (n / len(sources)) / 2
+
+    def metrics(self) -> pd.DataFrame:
+        """One row per author with every centrality metric"""
+        _, components = self.connected_components()
+        return pd.DataFrame({
+            'author': self.authors,
+            'degree': self.degree(),
+            'weighted_degree': self.weighted_degree(),
+            'component': components,
+            'pagerank': self.pagerank(),
+            'betweenness': self.approximate_betweenness(),
+        })
+
+    def __edge_sources(self) -> np.ndarray:
+        """Source author of every stored edge, aligned with indices"""
+        return np.repeat(np.arange(self.num_authors), self.degree())
+
+    def __neighbour_edges(self, frontier: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """(source, neighbour) for every edge leaving the frontier, gathered without a Python loop"""
+        starts, counts = self.indptr[frontier], self.indptr[frontier + 1] - self.indptr[frontier]
+        offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        return np.repeat(frontier, counts), self.indices[np.repeat(starts, counts) + offsets]
+
+    def __source_dependencies(self, source: int) -> np.ndarray:
+        """Brandes dependency of every author on shortest paths from source"""
+        n = self.num_authors
+        distance = np.full(n, -1)
+        paths = np.zeros(n)
+        distance[source], paths[source] = 0, 1.0
+
+        # Forward: count shortest paths level by level, keeping each level's tree edges.
+        levels = []
+        frontier = np.array([source])
+        while len(frontier):
+            parents, children = self.__neighbour_edges(frontier)
+            unseen = distance[children] < 0
+            distance[np.unique(children[unseen])] = distance[frontier[0]] + 1
+            tree = distance[children] == distance[frontier[0]] + 1
+            parents, children = parents[tree], children[tree]
+            np.add.at(paths, children, paths[parents])
+            levels.append((parents, children))
+            frontier = np.unique(children)
+
+        # Backward: accumulate dependencies from the deepest level up.
+        dependency = np.zeros(n)
+        for parents, children in reversed(levels):
+            np.add.at(dependency, parents, paths[parents] / paths[children] * (1 + dependency[children]))
+        dependency[source] = 0.0
+        return dependency
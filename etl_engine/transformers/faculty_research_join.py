@@ -0,0 +1,135 @@
+from typing import Iterator, List, Optional
+import numpy as np
+import pandas as pd
+from etl_engine.core.config import settings
+from etl_engine.models.transformer_models import FacultyResearchMapping
+from etl_engine.utils.keys import id_keys
+from etl_engine.utils.list_columns import explode_list_column, is_list_column
+from etl_engine.utils.names import NAME_COLUMNS, clean_name_part, normalize_names
+
+
+def hash_join_keys(build_keys: pd.Series, probe_keys: pd.Series) -> np.ndarray:
+    """Position of the build row matching each probe key, or -1
+
+    Missing and duplicated build keys never match, since they cannot name
+    one row. The hash table is built over the smaller side. When that is the
+    probe side, its distinct keys are hashed, so a hot key takes one slot
+    however many rows share it. Lookups are vectorized either way, so skew
+    does not create slow partitions.
+    """
+    build_keys = build_keys.reset_index(drop=True)
+    usable = (build_keys.notna() & ~build_keys.duplicated(keep=False)).to_numpy()
+    positions = np.flatnonzero(usable)
+    targets = pd.Index(build_keys[usable])
+
+    if len(targets) <= len(probe_keys):
+        slots = targets.get_indexer(probe_keys)
+        return np.append(positions, -1)[slots]
+
+    probe_codes, probe_uniques = pd.factorize(probe_keys, use_na_sentinel=True)
+    slots = pd.Index(probe_uniques).get_indexer(targets)
+    # The trailing -1 answers probe rows with a missing key (code -1).
+    build_for_code = np.full(len(probe_uniques) + 1, -1, dtype=np.int64)
+    found = slots >= 0
+    build_for_code[slots[found]] = positions[found]
+    return build_for_code[probe_codes]
+
+
+def _name_keys(df: pd.DataFrame) -> pd.Series:
+    missing = pd.Series(None, index=df.index, dtype="object")
+    names = normalize_names(*(df.get(column, missing) for column in NAME_COLUMNS))
+    return names.replace("", None)
+
+
+class FacultyResearchJoiner:
+    """Join faculty rows to research paper rows and collect each faculty member's research areas
+
+    Faculty rows (from SQLExtractor) are the build side. Paper rows (whole
+    frames or extract_iter chunks) are probed on faculty_id, then on the
+    normalized full name for papers whose id finds no faculty row. Only the
+    distinct (faculty, area) pairs are kept between chunks. An empty or
+    id-less faculty frame is accepted; its papers simply stay unmatched.
+    """
+
+    def __init__(self, faculty_df: pd.DataFrame):
+        self.faculty_df = faculty_df.reset_index(drop=True)
+        missing = pd.Series(None, index=self.faculty_df.index, dtype="object")
+        self._faculty_ids = id_keys(self.faculty_df.get('faculty_id', missing))
+        self._faculty_names = _name_keys(self.faculty_df)
+        self._pairs = pd.DataFrame({'faculty': pd.Series(dtype=np.int64), 'area': pd.Series(dtype=object)})
+        self.stats = {"papers": 0, "matched_by_id": 0, "matched_by_name": 0, "unmatched": 0}
+
+    def add_papers(self, research_df: pd.DataFrame) -> "FacultyResearchJoiner":
+        """Join one frame or chunk of paper rows"""
+        if research_df.empty:
+            return self
+        research_df = research_df.reset_index(drop=True)
+        matches = self.match(research_df)
+
+        matched = matches >= 0
+        areas = research_df['research_area'][matched]
+        areas.index = matches[matched]
+        if is_list_column(areas):
+            areas = explode_list_column(areas)
+        chunk_pairs = pd.DataFrame({'faculty': areas.index.to_numpy(), 'area': areas.astype(object).to_numpy()})
+        self._pairs = pd.concat([self._pairs, chunk_pairs.dropna()], ignore_index=True).drop_duplicates()
+        return self
+
+    def match(self, research_df: pd.DataFrame) -> np.ndarray:
+        """Faculty row position for every paper row, or -1; also updates stats"""
+        matches = np.full(len(research_df), -1, dtype=np.int64)
+        if 'faculty_id' in research_df.columns:
+            matches = hash_join_keys(self._faculty_ids, id_keys(research_df['faculty_id']))
+        id_matched = int((matches >= 0).sum())
+
+        # Name fallback, only for the papers the id did not place.
+        unplaced = np.flatnonzero(matches < 0)
+        if len(unplaced) and any(column in research_df.columns for column in NAME_COLUMNS):
+            paper_names = _name_keys(research_df.iloc[unplaced])
+            matches[unplaced] = hash_join_keys(self._faculty_names, paper_names)
+        name_matched = int((matches >= 0).sum()) - id_matched
+
+        self.stats["papers"] += len(research_df)
+        self.stats["matched_by_id"] += id_matched
+        self.stats["matched_by_name"] += name_matched
+        self.stats["unmatched"] += len(research_df) - id_matched - name_matched
+        return matches
+
+    @property
+    def match_rate(self) -> float:
+        return (self.stats["papers"] - self.stats["unmatched"]) / self.stats["papers"] if self.stats["papers"] else 0.0
+
+    def iter_mappings(self, chunk_size: Optional[int] = None) -> Iterator[List[FacultyResearchMapping]]:
+        """Emit FacultyResearchMapping records for every faculty member with matched papers, chunk_size at a time"""
+        chunk_size = chunk_size or settings.EXTRACT_CHUNK_SIZE
+        if self._pairs.empty:
+            return
+
+        areas_by_faculty = self._pairs.groupby('faculty', sort=True)['area'].agg(list)
+        faculty = self.faculty_df.iloc[areas_by_faculty.index.to_numpy()]
+        records = pd.DataFrame({
+            'faculty_name': self.__display_names(faculty).to_numpy(),
+            'research_areas': areas_by_faculty.to_numpy(),
+            'department': self.__text(faculty, 'department_name'),
+            'school': self.__text(faculty, 'school_name'),
+            'position': self.__text(faculty, 'position'),
+        })
+
+        for start in range(0, len(records), chunk_size):
+            yield [FacultyResearchMapping(**record) for record in records.iloc[start:start + chunk_size].to_dict('records')]
+
+    def report(self) -> str:
+        return (f"papers: {self.stats['papers']}, matched by faculty_id: {self.stats['matched_by_id']}, "
+                f"by name: {self.stats['matched_by_name']}, unmatched: {self.stats['unmatched']}, "
+                f"match rate: {self.match_rate:.1%}")
+
+    @staticmethod
+    def __display_names(faculty: pd.DataFrame) -> pd.Series:
+        parts = [clean_name_part(faculty[column]) for column in NAME_COLUMNS]
+        return parts[0].str.cat(parts[1:], sep=" ", na_rep="").str.replace(r"\s+", " ", regex=True).str.strip()
+
+    @staticmethod
+    def __text(faculty: pd.DataFrame, column: str) -> np.ndarray:
+        if column not in faculty.columns:
+            return np.full(len(faculty), "", dtype=object)
+        return faculty[column].astype(object).where(faculty[column].notna(), "").to_numpy()
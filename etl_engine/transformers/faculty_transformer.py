@@ -1,7 +1,7 @@
 import pandas as pd
-from typing import Dict, Any
-from collections import Counter
-from etl_engine.models.transformer_models import FacultyAnalysis
+from typing import Dict, Any, Iterable
+from etl_engine.transformers.partial_aggregates import FacultyPartialAggregate
+from etl_engine.utils.names import normalize_names
 
 class FacultyTransformer:
     @staticmethod
@@ -10,32 +10,27 @@ class FacultyTransformer:
         if faculty_df.empty:
             return {}
 
-        # Count faculty by position
-        position_counts = dict(Counter(faculty_df['position'].str.lower()))
+        # Count faculty by position, department and school in one pass
+        return FacultyPartialAggregate.from_frame(faculty_df).to_analysis().dict()
 
-        # Count faculty by department
-        department_counts = dict(Counter(faculty_df['department_name'].str.lower()))
-
-        # Count faculty by school
-        school_counts = dict(Counter(faculty_df['school_name'].str.lower()))
-
-        return FacultyAnalysis(
-            total_faculty=len(faculty_df),
-            positions_counts=position_counts,
-            department_counts=department_counts,
-            school_counts=school_counts
-        ).dict()
+    @staticmethod
+    def transform_faculty_chunks(faculty_chunks: Iterable[pd.DataFrame]) -> Dict[str, Any]:
+        """Same analysis as transform_facutly_data, computed chunk by chunk and merged"""
+        aggregate = FacultyPartialAggregate.merge_all(
+            FacultyPartialAggregate.from_frame(chunk) for chunk in faculty_chunks
+        )
+        if aggregate.total_faculty == 0:
+            return {}
+        return aggregate.to_analysis().dict()
 
     @staticmethod
     def normalize_faculty_names(faculty_df: pd.DataFrame) -> pd.DataFrame:
         """Create a standardized name format"""
-        faculty_df['normalized_name'] = faculty_df.apply(
-            lambda row: " ".join(filter(None, [
-                row['first_name'].lower().strip() if 'first_name' in row else '',
-                row['middle_name'].lower().strip() if 'middle_name' in row and row['middle_name'] else '',
-                row['last_name'].lower().strip() if 'last_name' in row else '',
-            ])),
-            axis=1
+        missing = pd.Series(None, index=faculty_df.index, dtype="object")
+        faculty_df['normalized_name'] = normalize_names(
+            faculty_df.get('first_name', missing),
+            faculty_df.get('middle_name', missing),
+            faculty_df.get('last_name', missing),
         )
 
         return faculty_df
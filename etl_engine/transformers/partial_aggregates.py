@@ -0,0 +1,96 @@
+from functools import reduce
+from typing import Any, Dict, Iterable
+import pandas as pd
+from pydantic import BaseModel
+from etl_engine.models.transformer_models import FacultyAnalysis, ResearchAnalysis
+from etl_engine.transformers.aggregation import count_dimensions, count_exploded
+from etl_engine.utils.list_columns import is_list_column
+
+
+def merge_counts(left: Dict[Any, int], right: Dict[Any, int]) -> Dict[Any, int]:
+    merged = dict(left)
+    for key, count in right.items():
+        merged[key] = merged.get(key, 0) + count
+    return merged
+
+
+class FacultyPartialAggregate(BaseModel):
+    """Faculty counts over part of the data; merge() combines parts exactly"""
+    total_faculty: int = 0
+    positions_counts: Dict[str, int] = {}
+    department_counts: Dict[str, int] = {}
+    school_counts: Dict[str, int] = {}
+
+    @classmethod
+    def from_frame(cls, faculty_df: pd.DataFrame) -> "FacultyPartialAggregate":
+        if faculty_df.empty:
+            return cls()
+        counts = count_dimensions(faculty_df, ['position', 'department_name', 'school_name'], lowercase=True)
+        return cls(
+            total_faculty=len(faculty_df),
+            positions_counts=counts['position'],
+            department_counts=counts['department_name'],
+            school_counts=counts['school_name'],
+        )
+
+    @classmethod
+    def merge_all(cls, parts: Iterable["FacultyPartialAggregate"]) -> "FacultyPartialAggregate":
+        return reduce(cls.merge, parts, cls())
+
+    def merge(self, other: "FacultyPartialAggregate") -> "FacultyPartialAggregate":
+        return FacultyPartialAggregate(
+            total_faculty=self.total_faculty + other.total_faculty,
+            positions_counts=merge_counts(self.positions_counts, other.positions_counts),
+            department_counts=merge_counts(self.department_counts, other.department_counts),
+            school_counts=merge_counts(self.school_counts, other.school_counts),
+        )
+
+    def to_analysis(self) -> FacultyAnalysis:
+        return FacultyAnalysis(**self.dict())
+
+
+class ResearchPartialAggregate(BaseModel):
+    """Publication counts over part of the data; merge() combines parts exactly"""
+    total_publications: int = 0
+    year_counts: Dict[int, int] = {}
+    research_area_counts: Dict[str, int] = {}
+    department_counts: Dict[str, int] = {}
+    school_counts: Dict[str, int] = {}
+
+    @classmethod
+    def from_frame(cls, research_df: pd.DataFrame) -> "ResearchPartialAggregate":
+        if research_df.empty:
+            return cls()
+
+        # A list-valued research_area is exploded and counted on its own,
+        # since it has a different number of rows.
+        dimensions = ['published_year', 'department', 'school']
+        area_is_list = is_list_column(research_df['research_area'])
+        if not area_is_list:
+            dimensions.append('research_area')
+        counts = count_dimensions(research_df, dimensions)
+        area_counts = count_exploded(research_df['research_area']) if area_is_list else counts['research_area']
+
+        return cls(
+            total_publications=len(research_df),
+            year_counts=counts['published_year'],
+            research_area_counts=area_counts,
+            department_counts=counts['department'],
+            school_counts=counts['school'],
+        )
+
+    @classmethod
+    def merge_all(cls, parts: Iterable["ResearchPartialAggregate"]) -> "ResearchPartialAggregate":
+        return reduce(cls.merge, parts, cls())
+
+    def merge(self, other: "ResearchPartialAggregate") -> "ResearchPartialAggregate":
+        return ResearchPartialAggregate(
+            total_publications=self.total_publications + other.total_publications,
+            year_counts=merge_counts(self.year_counts, other.year_counts),
+            research_area_counts=merge_counts(self.research_area_counts, other.research_area_counts),
+            department_counts=merge_counts(self.department_counts, other.department_counts),
+            school_counts=merge_counts(self.school_counts, other.school_counts),
+        )
+
+    def to_analysis(self) -> ResearchAnalysis:
+        return ResearchAnalysis(**self.dict())
@@ -1,7 +1,11 @@
+import numpy as np
 import pandas as pd
-from typing import Counter, Dict, List, Any
-from collections import defaultdict
-from etl_engine.models.transformer_models import ResearchAnalysis
+from typing import Dict, Iterable, Any
+from etl_engine.models.transformer_models import CoauthorNetworkAnalysis
+from etl_engine.transformers.coauthor_graph import CoauthorGraph, paper_authors
+from etl_engine.transformers.partial_aggregates import ResearchPartialAggregate
+from etl_engine.transformers.sketches import ResearchSketchAggregate
+from etl_engine.utils.list_columns import explode_list_column, is_list_column
 
 class ResearchTransformer:
     @staticmethod
@@ -10,34 +14,74 @@ class ResearchTransformer:
         if research_df.empty:
             return {}
 
-        # Number of publications by year
-        year_counts = dict(Counter(research_df['published_year']))
+        # Number of publications by year, research area, department and school
+        return ResearchPartialAggregate.from_frame(research_df).to_analysis().dict()
 
-        # Number of publications by research area
-        research_area = research_df['research_area'].explode()
-        area_counts = dict(Counter(research_area))
-
-        # Number of publications by department
-        dept_counts = dict(Counter(research_df['department']))
-
-        # Number of publications by school
-        school_counts = dict(Counter(research_df['school']))
+    @staticmethod
+    def transform_research_chunks(research_chunks: Iterable[pd.DataFrame]) -> Dict[str, Any]:
+        """Same analysis as transform_research_data, computed chunk by chunk and merged"""
+        aggregate = ResearchPartialAggregate.merge_all(
+            ResearchPartialAggregate.from_frame(chunk) for chunk in research_chunks
+        )
+        if aggregate.total_publications == 0:
+            return {}
+        return aggregate.to_analysis().dict()
 
-        return ResearchAnalysis(
-            total_publications=len(research_df),
-            year_counts=year_counts,
-            research_area_counts=area_counts,
-            department_counts=dept_counts,
-            school_counts=school_counts,
-        ).dict()
+    @staticmethod
+    def transform_research_sketches(research_chunks: Iterable[pd.DataFrame], top_k: int = 10) -> Dict[str, Any]:
+        """Approximate distinct counts and top research areas in fixed memory, chunk by chunk"""
+        aggregate = ResearchSketchAggregate.merge_all(
+            (ResearchSketchAggregate.from_frame(chunk, top_k=top_k) for chunk in research_chunks), top_k=top_k
+        )
+        if aggregate.total_publications == 0:
+            return {}
+        return aggregate.to_analysis().dict()
 
     @staticmethod
     def get_research_areas_by_faculty(research_df: pd.DataFrame) -> Dict[str, Any]:
         """Create a mapping of faculty names to their research areas"""
-        faculty_research = defaultdict(list)
+        if research_df.empty:
+            return {}
+
+        # Every paper credits its faculty member and each of its coauthors.
+        research_df = research_df.reset_index(drop=True)
+        author_names = paper_authors(research_df)
+        if author_names.empty:
+            return {}
+
+        # Rows keep the paper's position, so joining on it pairs authors with areas.
+        areas = research_df['research_area']
+        if is_list_column(areas):
+            areas = explode_list_column(areas)
+        pairs = pd.merge(author_names, areas.rename('area'), left_index=True, right_index=True)
+
+        pairs = pairs.dropna().drop_duplicates()
+        # Areas stay encoded through deduplication and are decoded only for the output lists.
+        pairs = pairs.astype({'area': object})
+        return pairs.groupby('author', sort=False)['area'].agg(list).to_dict()
+
+    @staticmethod
+    def transform_coauthor_network(research_df: pd.DataFrame, top_n: int = 10,
+                                   betweenness_samples: int = 64) -> Dict[str, Any]:
+        """Summarize the coauthor graph: size, components and the most central authors"""
+        if research_df.empty:
+            return {}
 
-        for _, row in research_df.iterrows():
-            for author in row['authors']:
-                faculty_research[author.lower().strip()].extend(row['research_area'])
+        graph = CoauthorGraph.from_papers(research_df)
+        if graph.num_authors == 0:
+            return {}
+        component_count, components = graph.connected_components()
 
-        return {k: list(set(v)) for k, v in faculty_research.items()}
+        def top(scores: np.ndarray, cast) -> Dict[str, Any]:
+            order = np.argsort(-scores, kind='stable')[:top_n]
+            return {graph.authors[i]: cast(scores[i]) for i in order}
+
+        return CoauthorNetworkAnalysis(
+            total_authors=graph.num_authors,
+            total_collaborations=graph.num_edges,
+            connected_components=component_count,
+            largest_component_size=int(np.bincount(components).max()),
+            top_authors_by_degree=top(graph.degree(), int),
+            top_authors_by_pagerank=top(graph.pagerank(), float),
+            top_authors_by_betweenness=top(graph.approximate_betweenness(betweenness_samples), float),
+        ).dict()
@@ -0,0 +1,51 @@
+import math
+from typing import Any, Iterable
+import numpy as np
+import pandas as pd
+
+# Two independent 16-byte keys for pandas' vectorized SipHash; the k bit
+# positions are derived from the pair by double hashing.
+_HASH_KEYS = ("bloomfilterkey01", "bloomfilterkey02")
+
+
+class BloomFilter:
+    """Compact set-membership test for a large key set; no false negatives
+
+    Sized for capacity keys at the given false-positive rate. Keys are
+    compared as strings, so 1 and "1" are the same key.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        capacity = max(capacity, 1)
+        self.num_bits = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.bits = np.zeros(math.ceil(self.num_bits / 8), dtype=np.uint8)
+
+    @classmethod
+    def from_keys(cls, keys: Iterable[Any], error_rate: float = 0.01) -> "BloomFilter":
+        keys = list(keys)
+        bloom = cls(len(keys), error_rate)
+        bloom.add_many(keys)
+        return bloom
+
+    def add_many(self, keys: Iterable[Any]) -> None:
+        positions = self.__positions(keys).ravel()
+        np.bitwise_or.at(self.bits, positions >> 3, (1 << (positions & 7)).astype(np.uint8))
+
+    def contains_many(self, keys: Iterable[Any]) -> np.ndarray:
+        """Membership for each key in one vectorized pass; missing keys are never members"""
+        keys = list(keys)
+        positions = self.__positions(keys)
+        hits = (self.bits[positions >> 3] >> (positions & 7)) & 1
+        return hits.all(axis=1) & np.array([key is not None for key in keys], dtype=bool)
+
+    def __contains__(self, key: Any) -> bool:
+        return bool(self.contains_many([key])[0])
+
+    def __positions(self, keys: Iterable[Any]) -> np.ndarray:
+        """(len(keys), num_hashes) bit positions"""
+        values = np.array([str(key) for key in keys], dtype=object)
+        first = pd.util.hash_array(values, hash_key=_HASH_KEYS[0], categorize=False)
+        second = pd.util.hash_array(values, hash_key=_HASH_KEYS[1], categorize=False)
+        steps = np.arange(self.num_hashes, dtype=np.uint64)
+        return ((first[:, None] + steps[None, :] * second[:, None]) % np.uint64(self.num_bits)).astype(np.int64)
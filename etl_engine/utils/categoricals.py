@@ -0,0 +1,133 @@
+import threading
+from typing import Dict, List, Optional
+import numpy as np
+import pandas as pd
+from etl_engine.core.config import settings
+from etl_engine.utils.list_columns import is_list_column
+
+
+class CategoryDictionary:
+    """Append-only value dictionaries shared by every chunk an extractor emits
+
+    Each encoded column maps to a domain, so e.g. SQL department_name and
+    Mongo department share the "department" dictionary. Values are stored
+    stripped of surrounding whitespace. A value keeps the code it got when
+    first seen, so codes agree across chunks and earlier chunks only need
+    their dtype widened (align) before concatenation.
+    """
+
+    def __init__(self, columns: Optional[Dict[str, str]] = None):
+        self.columns = dict(columns if columns is not None else settings.CATEGORICAL_COLUMNS)
+        self._categories: Dict[str, pd.Index] = {}
+        self._lock = threading.Lock()
+
+    def categories(self, column: str) -> pd.Index:
+        """Every value seen so far for the column's domain, in code order"""
+        return self._categories.get(self.columns.get(column, column), pd.Index([], dtype=object))
+
+    def encode(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Dictionary-encode the configured columns of df; list-valued columns are left alone"""
+        encoded = {
+            column: self.encode_column(column, df[column])
+            for column in df.columns
+            if column in self.columns and not is_list_column(df[column])
+        }
+        return df.assign(**encoded) if encoded else df
+
+    def encode_column(self, column: str, values: pd.Series) -> pd.Series:
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            local_codes, local_values = values.cat.codes.to_numpy(), values.cat.categories
+        else:
+            local_codes, local_values = pd.factorize(values, use_na_sentinel=True)
+        # Only the chunk's distinct values are stripped and looked up, never its rows.
+        local_values = pd.Index(local_values, dtype=object).map(_strip_value)
+
+        domain = self.columns[column]
+        with self._lock:
+            known = self._categories.get(domain, pd.Index([], dtype=object))
+            new_values = local_values[known.get_indexer(local_values) < 0].unique()
+            if len(new_values):
+                known = known.append(new_values)
+                self._categories[domain] = known
+
+        # The trailing -1 keeps missing values (local code -1) missing.
+        mapping = np.append(known.get_indexer(local_values), -1)
+        codes = mapping[local_codes]
+        return pd.Series(
+            pd.Categorical.from_codes(codes, dtype=pd.CategoricalDtype(known)),
+            index=values.index, name=values.name
+        )
+
+    def align(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Widen encoded columns to the current dictionaries
+
+        A column encoded earlier holds a prefix of the dictionary, so its codes
+        are kept. A column whose categories were changed since (e.g. renamed)
+        is re-encoded by value instead.
+        """
+        aligned = {}
+        for column in df.columns:
+            values = df[column]
+            if column in self.columns and isinstance(values.dtype, pd.CategoricalDtype):
+                categories = self.categories(column)
+                local = values.cat.categories
+                if local.equals(categories):
+                    continue
+                if local.equals(categories[:len(local)]):
+                    aligned[column] = pd.Series(
+                        pd.Categorical.from_codes(values.cat.codes, dtype=pd.CategoricalDtype(categories)),
+                        index=values.index, name=values.name
+                    )
+                else:
+                    aligned[column] = self.encode_column(column, values)
+        return df.assign(**aligned) if aligned else df
+
+    def concat(self, frames: List[pd.DataFrame]) -> pd.DataFrame:
+        """Concatenate encoded chunks so the result stays categorical"""
+        # Re-encoding a frame by value can add values, so widen again once all are encoded.
+        encoded = [self.align(frame) for frame in frames]
+        return pd.concat([self.align(frame) for frame in encoded], ignore_index=True)
+
+
+def resolve_categories(categories: Optional[CategoryDictionary]) -> Optional[CategoryDictionary]:
+    """The extractor's dictionary: the one passed in, else a fresh one when EXTRACT_CATEGORICAL is on"""
+    if categories is None and settings.EXTRACT_CATEGORICAL:
+        return CategoryDictionary()
+    return categories
+
+
+def encode_frame(df: pd.DataFrame, categories: Optional[CategoryDictionary]) -> pd.DataFrame:
+    """Dictionary-encode df when the extractor has a CategoryDictionary"""
+    return categories.encode(df) if categories is not None else df
+
+
+def concat_frames(frames: List[pd.DataFrame], categories: Optional[CategoryDictionary]) -> pd.DataFrame:
+    """Concatenate the non-empty chunks, keeping encoded columns categorical; empty frame if none"""
+    frames = [frame for frame in frames if not frame.empty]
+    if not frames:
+        return pd.DataFrame()
+    if categories is not None:
+        return categories.concat(frames)
+    return pd.concat(frames, ignore_index=True)
+
+
+def _strip_value(value):
+    return value.strip() if isinstance(value, str) else value
+
+
+def strip_categories(values: pd.Series) -> pd.Series:
+    """Strip whitespace once per category instead of once per row"""
+    categories = values.cat.categories
+    stripped = pd.Index(categories.astype(str).str.strip(), dtype=object)
+    if stripped.equals(pd.Index(categories, dtype=object)):
+        return values
+    if stripped.is_unique:
+        return values.cat.rename_categories(stripped)
+
+    # Values that only differed in surrounding whitespace collapse into one.
+    merged_codes, merged_categories = pd.factorize(stripped)
+    codes = np.append(merged_codes, -1)[values.cat.codes.to_numpy()]
+    return pd.Series(
+        pd.Categorical.from_codes(codes, categories=pd.Index(merged_categories, dtype=object)),
+        index=values.index, name=values.name
+    )
@@ -0,0 +1,92 @@
+import json
+from typing import Any, Iterator, TextIO
+
+_WHITESPACE = " \t\r\n"
+# Characters that can follow a complete array item.
+_ITEM_END = _WHITESPACE + ",]"
+
+
+def iter_json_records(path: str, read_size: int = 1 << 20) -> Iterator[Any]:
+    """Yield the items of a top-level JSON array, or the lines of an NDJSON file, one at a time"""
+    with open(path, "r", encoding="utf-8") as file:
+        first = _peek_first_char(file)
+        if first == "[":
+            yield from _iter_json_array(file, read_size)
+        elif first:
+            yield from _iter_ndjson(file)
+
+
+def _peek_first_char(file: TextIO) -> str:
+    while True:
+        char = file.read(1)
+        if not char or char not in _WHITESPACE:
+            file.seek(0)
+            return char
+
+
+def _iter_ndjson(file: TextIO) -> Iterator[Any]:
+    for line_number, line in enumerate(file, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON on line {line_number}: {e}") from e
+
+
+def _iter_json_array(file: TextIO, read_size: int) -> Iterator[Any]:
+    """Decode array items with raw_decode, so only a read_size window is held in memory
+
+    The array is checked as strictly as json.loads: items are separated by
+    exactly one comma and only whitespace may follow the closing bracket.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    position = 0
+    eof = False
+    expect = "["  # "[" at the start, then "item", "item or ]", ", or ]" and finally "end"
+
+    while True:
+        while position < len(buffer) and buffer[position] in _WHITESPACE:
+            position += 1
+
+        if position < len(buffer):
+            char = buffer[position]
+            if expect == "end":
+                raise ValueError(f"Unexpected data after the JSON array: {buffer[position:position + 20]!r}")
+            if expect == "[" or (expect == ", or ]" and char == ","):
+                if char != expect[0]:
+                    raise ValueError(f"Expected {expect!r} in JSON array, found {char!r}")
+                position += 1
+                expect = "item or ]" if char == "[" else "item"
+                continue
+            if char == "]" and expect in ("item or ]", ", or ]"):
+                position += 1
+                expect = "end"
+                continue
+            if expect == ", or ]":
+                raise ValueError(f"Expected ',' or ']' in JSON array, found {char!r}")
+
+            try:
+                item, end = decoder.raw_decode(buffer, position)
+                # A number cut by the read boundary still decodes ("10." as
+                # 10), so only trust an item once its terminator is buffered.
+                if eof or (end < len(buffer) and buffer[end] in _ITEM_END):
+                    yield item
+                    position = end
+                    expect = ", or ]"
+                    continue
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+
+        if eof:
+            if expect == "end":
+                return
+            raise ValueError("Unexpected end of file inside a JSON array")
+
+        data = file.read(read_size)
+        eof = not data
+        buffer = buffer[position:] + data
+        position = 0
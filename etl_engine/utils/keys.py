@@ -0,0 +1,6 @@
+import pandas as pd
+
+
+def id_keys(ids: pd.Series) -> pd.Series:
+    """faculty_id as trimmed strings, so SQL integers and Mongo strings compare equal"""
+    return ids.astype("string").str.strip().replace("", pd.NA)
@@ -0,0 +1,70 @@
+from typing import Optional, Sequence
+import numpy as np
+import pandas as pd
+
+# List columns can be held either as Python lists in an object column or as
+# Arrow list arrays: one flat values buffer plus an offsets buffer, so no
+# per-row list objects. pyarrow is only needed for the latter.
+
+
+def is_arrow_list(values: pd.Series) -> bool:
+    """True when the column is an Arrow list array"""
+    if not isinstance(values.dtype, pd.ArrowDtype):
+        return False
+    import pyarrow as pa
+    return pa.types.is_list(values.dtype.pyarrow_dtype) or pa.types.is_large_list(values.dtype.pyarrow_dtype)
+
+
+def is_list_column(values: pd.Series) -> bool:
+    """True for Arrow list arrays and object columns holding lists (checked on the first non-null value)"""
+    if is_arrow_list(values):
+        return True
+    if values.dtype != object:
+        return False
+    first_valid = values.first_valid_index()
+    return first_valid is not None and isinstance(values.loc[first_valid], (list, tuple, np.ndarray))
+
+
+def build_list_column(flat_values: Sequence, offsets: Sequence[int], index: Optional[pd.Index] = None,
+                      name: Optional[str] = None) -> pd.Series:
+    """Wrap a flat values buffer and its offsets (len(rows) + 1, starting at 0) as an Arrow list column"""
+    import pyarrow as pa
+
+    list_array = pa.ListArray.from_arrays(
+        pa.array(np.asarray(offsets, dtype=np.int32)), pa.array(flat_values, type=pa.string())
+    )
+    return pd.Series(pd.arrays.ArrowExtensionArray(list_array), index=index, name=name)
+
+
+def to_list_column(values: pd.Series) -> pd.Series:
+    """Convert an object column of lists to an Arrow list column"""
+    if is_arrow_list(values):
+        return values
+    import pyarrow as pa
+
+    list_array = pa.array(values.tolist(), type=pa.list_(pa.string()), from_pandas=True)
+    return pd.Series(pd.arrays.ArrowExtensionArray(list_array), index=values.index, name=values.name)
+
+
+def explode_list_column(values: pd.Series) -> pd.Series:
+    """One row per list element, keeping the parent row's index label
+
+    Arrow list arrays are exploded from their flat buffer without touching
+    Python objects. Empty lists, missing rows and missing elements produce
+    no rows.
+    """
+    if is_arrow_list(values):
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        lists = pa.array(values.array)
+        flat = pc.list_flatten(lists)
+        parents = pc.list_parent_indices(lists)
+        valid = pc.is_valid(flat)
+        flat, parents = pc.filter(flat, valid), pc.filter(parents, valid)
+        return pd.Series(
+            pd.arrays.ArrowExtensionArray(flat), index=values.index[parents.to_numpy()], name=values.name
+        )
+
+    exploded = values.explode()
+    return exploded[exploded.notna()]
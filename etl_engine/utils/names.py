@@ -0,0 +1,47 @@
+import pandas as pd
+
+# Placeholders that stand for "no value" in name columns, e.g. the literal
+# "NULL" middle names in faculties.json.
+NULL_NAME_TOKENS = ["null", "none", "nan", ""]
+
+NAME_COLUMNS = ["first_name", "middle_name", "last_name"]
+
+
+def clean_name_part(names: pd.Series) -> pd.Series:
+    """Strip a name column and turn NULL placeholders into missing values"""
+    names = names.astype("string").str.strip()
+    return names.mask(names.str.lower().isin(NULL_NAME_TOKENS))
+
+
+def split_full_name(full_names: pd.Series) -> pd.DataFrame:
+    """Split whole-name strings into first/middle/last columns in one vectorized pass
+
+    Two-part names fill first and last name, three-part names also fill the
+    middle name; any other shape leaves all three missing.
+    """
+    parts = clean_name_part(full_names).str.split(expand=True)
+    for position in range(3):
+        if position not in parts.columns:
+            parts[position] = pd.NA
+
+    part_count = parts.notna().sum(axis=1)
+    has_two, has_three = part_count == 2, part_count == 3
+
+    return pd.DataFrame({
+        "first_name": parts[0].where(has_two | has_three),
+        "middle_name": parts[1].where(has_three),
+        "last_name": parts[1].where(has_two).fillna(parts[2].where(has_three)),
+    }, index=full_names.index).astype("object").where(lambda df: df.notna(), None)
+
+
+def normalize_names(first_names: pd.Series, middle_names: pd.Series, last_names: pd.Series) -> pd.Series:
+    """Lowercase, strip and join name parts column-wise, skipping missing or NULL parts"""
+    parts = [clean_name_part(part).str.lower() for part in (first_names, middle_names, last_names)]
+    joined = parts[0].str.cat(parts[1:], sep=" ", na_rep="")
+    return joined.str.replace(r"\s+", " ", regex=True).str.strip().astype("object")
+
+
+def normalize_full_name(full_names: pd.Series) -> pd.Series:
+    """Lowercase and strip whole-name strings, collapsing inner whitespace; NULL placeholders become missing"""
+    names = clean_name_part(full_names).str.lower()
+    return names.str.replace(r"\s+", " ", regex=True).astype("object")
@@ -2,6 +2,7 @@ import re
 from typing import Any, Dict, List
 from datetime import datetime
 import pandas as pd
+from etl_engine.utils.categoricals import strip_categories
 
 
 class DataValidator:
@@ -27,12 +28,13 @@ class DataValidator:
         # Remove duplicates
         df = df.drop_duplicates()
 
-        # Handle missing values
-        df.fillna("")
-
         # Clean string columns
         string_columns = df.select_dtypes(include=['object']).columns
         for col in string_columns:
             df[col] = df[col].astype(str).str.strip()
 
+        # Categorical columns stay encoded; only their dictionaries are cleaned
+        for col in df.select_dtypes(include=['category']).columns:
+            df[col] = strip_categories(df[col])
+
         return df